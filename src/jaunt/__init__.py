@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from importlib.metadata import PackageNotFoundError, version
+import functools
 
 from jaunt.errors import (
     JauntConfigError,
@@ -14,7 +14,12 @@ from jaunt.runtime import contract, magic, preserve, sig, test
 from jaunt.module_magic import magic_module
 
 
+@functools.cache
 def _package_version() -> str:
+    # importlib.metadata is slow to import, and every process that uses @magic imports
+    # this package, so the version is only looked up when someone asks for it.
+    from importlib.metadata import PackageNotFoundError, version
+
     try:
         return version("jaunt")
     except PackageNotFoundError:
@@ -22,7 +27,11 @@ def _package_version() -> str:
         return "0.0.0"
 
 
-__version__ = _package_version()
+def __getattr__(name: str) -> str:
+    if name == "__version__":
+        return _package_version()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "__version__",
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass, field
 
 import jaunt
@@ -24,16 +25,26 @@ _COST_TABLE: dict[str, tuple[float, float]] = {
 }
 
 
+# Longest first so "gpt-4.1-mini" beats "gpt-4.1".
+_PREFIXES_LONGEST_FIRST: tuple[str, ...] = tuple(sorted(_COST_TABLE, key=len, reverse=True))
+
+
+@functools.lru_cache(maxsize=64)
+def _rates_for(model: str) -> tuple[float, float] | None:
+    """Resolve a model's per-1M-token rates by longest prefix, once per model name."""
+    for prefix in _PREFIXES_LONGEST_FIRST:
+        if model.startswith(prefix):
+            return _COST_TABLE[prefix]
+    return None
+
+
 def _estimate_cost(model: str, prompt_tokens: int, completion_tokens: int) -> float:
     """Return estimated cost in USD. Returns 0.0 for unknown models."""
-    # Try longest prefix match first so "gpt-4.1-mini" beats "gpt-4.1".
-    prefixes: list[str] = list(_COST_TABLE.keys())
-    prefixes.sort(key=len, reverse=True)
-    for prefix in prefixes:
-        if model.startswith(prefix):
-            inp_rate, out_rate = _COST_TABLE[prefix]
-            return (prompt_tokens * inp_rate + completion_tokens * out_rate) / 1_000_000
-    return 0.0
+    rates = _rates_for(model)
+    if rates is None:
+        return 0.0
+    inp_rate, out_rate = rates
+    return (prompt_tokens * inp_rate + completion_tokens * out_rate) / 1_000_000
 
 
 @jaunt.contract
@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 import ast
+import functools
 import hashlib
 import json
 import textwrap
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
 
 import jaunt
 from jaunt.class_analysis import is_preserve_decorator, is_stub_body, split_class_members
@@ -17,6 +19,36 @@ from jaunt.registry import SpecEntry
 from jaunt.spec_ref import SpecRef, normalize_spec_refs
 
 
+def _read_source(source_file: str) -> str:
+    return Path(source_file).read_text(encoding="utf-8")
+
+
+@functools.lru_cache(maxsize=64)
+def _top_level_segments(
+    src: str, filename: str
+) -> tuple[Mapping[str, str | None], Mapping[str, str | None]]:
+    """Map top-level names in a spec file to their raw source segments.
+
+    Returns ``(classes, definitions)``: the first ``class`` with each name, and
+    the first function or class with each name. Every spec in a module reads the
+    same file, so keying on the text parses it once per module digest (and an
+    edit always invalidates). Only the read-only segment maps are kept, not the
+    tree.
+    """
+
+    tree = ast.parse(src, filename=filename)
+    classes: dict[str, str | None] = {}
+    definitions: dict[str, str | None] = {}
+    for top in tree.body:
+        if not isinstance(top, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            continue
+        seg = ast.get_source_segment(src, top)
+        definitions.setdefault(top.name, seg)
+        if isinstance(top, ast.ClassDef):
+            classes.setdefault(top.name, seg)
+    return MappingProxyType(classes), MappingProxyType(definitions)
+
+
 def extract_source_segment(entry: SpecEntry) -> str:
     """Extract a normalized source segment for the entry's definition.
 
@@ -25,34 +57,20 @@ def extract_source_segment(entry: SpecEntry) -> str:
     so that the digest covers sibling changes and the LLM gets full context.
     """
 
-    src = Path(entry.source_file).read_text(encoding="utf-8")
-    tree = ast.parse(src, filename=entry.source_file)
-
-    node: ast.ClassDef | ast.FunctionDef | ast.AsyncFunctionDef | None = None
+    src = _read_source(entry.source_file)
+    classes, definitions = _top_level_segments(src, entry.source_file)
 
     if "." in entry.qualname:
         # Method spec: extract the enclosing class.
         class_name = entry.qualname.split(".")[0]
-        for top in tree.body:
-            if isinstance(top, ast.ClassDef) and top.name == class_name:
-                node = top
-                break
-    else:
-        for top in tree.body:
-            if (
-                isinstance(top, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef))
-                and top.name == entry.qualname
-            ):
-                node = top
-                break
-
-    if node is None:
-        if "." in entry.qualname:
-            class_name = entry.qualname.split(".")[0]
+        if class_name not in classes:
             raise ValueError(f"Enclosing class {class_name!r} not found for {entry.spec_ref!s}")
-        raise ValueError(f"Top-level definition not found for {entry.spec_ref!s}")
+        seg = classes[class_name]
+    else:
+        if entry.qualname not in definitions:
+            raise ValueError(f"Top-level definition not found for {entry.spec_ref!s}")
+        seg = definitions[entry.qualname]
 
-    seg = ast.get_source_segment(src, node)
     if seg is None:
         raise ValueError(f"Unable to extract source for {entry.spec_ref!s}")
 
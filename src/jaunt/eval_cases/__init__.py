@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import functools
+from dataclasses import dataclass, replace
 
 
 @dataclass(frozen=True, slots=True)
@@ -15,7 +16,16 @@ class BuiltinEvalCase:
 def get_builtin_eval_cases() -> list[BuiltinEvalCase]:
     """Return the built-in eval suite definitions."""
 
-    return [
+    # Cases are frozen but `files` is a plain dict; hand out copies so callers
+    # cannot mutate the cached suite.
+    return [replace(c, files=dict(c.files)) for c in _builtin_eval_cases()]
+
+
+@functools.cache
+def _builtin_eval_cases() -> tuple[BuiltinEvalCase, ...]:
+    # The suite is constant: build it once per process instead of rebuilding
+    # every case on each `load_cases` call.
+    return (
         BuiltinEvalCase(
             case_id="simple_function",
             description="Simple function (pure logic, no deps).",
@@ -569,4 +579,4 @@ rng = random.Random(0)
 assert roll("2d6+3", rng=rng) == 11
 """,
         ),
-    ]
+    )
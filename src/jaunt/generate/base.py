@@ -130,6 +130,7 @@ GenerationModuleResult: TypeAlias = (
 _MAX_INFRASTRUCTURE_RETRIES = 2
 _INITIAL_QUOTA_WAIT_SECONDS = 60.0
 _MAX_QUOTA_WAIT_SECONDS = 8 * 60.0
+_RETRY_ERROR_PREFIX = "previous output errors: "
 
 
 @dataclass(slots=True)
@@ -432,8 +433,7 @@ class GeneratorBackend(ABC):
             if attempts < max_attempts:
                 if progress is not None:
                     progress("retry", last_errors[0] if last_errors else f"attempt {attempts}")
-                retry_context = [f"previous output errors: {error}" for error in last_errors]
-                extra_ctx = [*(extra_ctx or []), *retry_context]
+                extra_ctx = [*(extra_ctx or []), *(_RETRY_ERROR_PREFIX + e for e in last_errors)]
                 attempt_request = replace(request, seed_target_content=last_source)
 
         return GenerationResult(
@@ -481,6 +481,10 @@ class GeneratorBackend(ABC):
         total_cached_prompt = 0
         infrastructure_errors: list[str] = []
         quota = self._quota_retry_state()
+        # `validate_generated_source` is a pure function of the source, so a retry that
+        # returns byte-identical output reuses the previous structural verdict.
+        validated_source: str | None = None
+        structural_errors: list[str] = []
 
         while attempts < max_attempts:
             attempts += 1
@@ -525,7 +529,10 @@ class GeneratorBackend(ABC):
                 total_completion += usage.completion_tokens
                 total_cached_prompt += usage.cached_prompt_tokens
 
-            last_errors = validate_generated_source(last_source, ctx.expected_names)
+            if last_source != validated_source:
+                structural_errors = validate_generated_source(last_source, ctx.expected_names)
+                validated_source = last_source
+            last_errors = structural_errors
             if not last_errors and extra_validator is not None:
                 last_errors = extra_validator(last_source)
             if not last_errors:
@@ -558,8 +565,7 @@ class GeneratorBackend(ABC):
             # Retry with appended context describing what was wrong previously.
             if progress is not None:
                 progress("retry", f"attempt {attempts}")
-            retry_ctx = [f"previous output errors: {e}" for e in last_errors]
-            extra_ctx = (extra_ctx or []) + retry_ctx
+            extra_ctx = [*(extra_ctx or []), *(_RETRY_ERROR_PREFIX + e for e in last_errors)]
 
         agg = (
             TokenUsage(
@@ -2,28 +2,78 @@
 
 from __future__ import annotations
 
+import functools
 import re
 from importlib import resources
+from importlib.resources.abc import Traversable
 from pathlib import Path
 
+_PLACEHOLDER_RE = re.compile(r"\{\{([A-Za-z0-9_]+)\}\}")
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_template(text: str) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Split a template into literal chunks and the placeholder names between them.
+
+    The first tuple always has exactly one more element than the second.
+    """
+
+    statics: list[str] = []
+    names: list[str] = []
+    pos = 0
+    for m in _PLACEHOLDER_RE.finditer(text):
+        statics.append(text[pos : m.start()])
+        names.append(m.group(1))
+        pos = m.end()
+    statics.append(text[pos:])
+    return tuple(statics), tuple(names)
+
 
 def render_template(text: str, mapping: dict[str, str]) -> str:
-    """Very small template renderer: replaces `{{name}}` placeholders."""
+    """Very small template renderer: replaces `{{name}}` placeholders.
 
-    rendered = text
-    for key, value in mapping.items():
-        rendered = rendered.replace(f"{{{{{key}}}}}", value)
-    return rendered
+    The template is scanned once (and the split is cached per template text).
+    Placeholders missing from `mapping` are left as-is, and substituted values are
+    never rescanned, so a value that itself contains `{{...}}` is inserted verbatim.
+    """
 
+    statics, names = _parse_template(text)
+    if not any(name in mapping for name in names):
+        # Nothing to substitute: hand back the original string without copying it.
+        return text
+    parts = [statics[0]]
+    for name, static in zip(names, statics[1:], strict=True):
+        value = mapping.get(name)
+        parts.append("{{" + name + "}}" if value is None else value)
+        parts.append(static)
+    return "".join(parts)
 
-_FENCE_RE = re.compile(r"^\s*```[a-zA-Z0-9_-]*\s*\n(?P<code>.*)\n\s*```\s*$", re.DOTALL)
+
+_FENCE_INFO_CHARS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_-")
 
 
 def strip_markdown_fences(text: str) -> str:
-    m = _FENCE_RE.match(text or "")
-    if not m:
-        return (text or "").strip()
-    return (m.group("code") or "").strip()
+    """Return the body of a single fenced code block, or the stripped text otherwise.
+
+    The opening fence may carry an `[A-Za-z0-9_-]` info string and the closing fence
+    must sit on its own final line. A bounded scan from both ends replaces the old
+    DOTALL regex, so the body is never backtracked over.
+    """
+    s = (text or "").strip()
+    if not s.startswith("```") or not s.endswith("```"):
+        return s
+    open_nl = s.find("\n", 3)
+    if open_nl < 0:
+        return s
+    info = s[3:open_nl].rstrip()
+    if not all(ch in _FENCE_INFO_CHARS for ch in info):
+        return s
+    body_end = len(s) - 3
+    close_nl = s.rfind("\n", 0, body_end)
+    closing_indent = s[close_nl + 1 : body_end]
+    if close_nl <= open_nl or (closing_indent and not closing_indent.isspace()):
+        return s
+    return s[open_nl + 1 : close_nl].strip()
 
 
 def fmt_kv_block(items: list[tuple[str, str]], *, empty: str = "(none)") -> str:
@@ -36,24 +86,44 @@ def fmt_kv_block(items: list[tuple[str, str]], *, empty: str = "(none)") -> str:
 
 
 def load_prompt(default_name: str, override_path: str | None) -> str:
-    """Load a prompt template from the packaged defaults or a user-specified path."""
+    """Load a prompt template from the packaged defaults or a user-specified path.
+
+    Packaged prompts are immutable for the life of the process and are read once.
+    Overrides are user files that may change under `jaunt watch`, so they are always
+    read fresh.
+    """
     if override_path:
         return Path(override_path).read_text(encoding="utf-8")
-    p = resources.files("jaunt") / "prompts" / default_name
-    return p.read_text(encoding="utf-8")
+    return _load_packaged_prompt(default_name)
 
 
-def async_test_info(async_runner: str) -> str:
-    """Return prompt guidance for async test functions based on the configured runner."""
-    if async_runner == "anyio":
-        return (
-            "- If a test spec uses `async def`, the generated test MUST also be `async def` "
-            "and decorated with `@pytest.mark.anyio` (import pytest; the anyio pytest plugin "
-            "handles running async tests on the configured backend)."
-        )
-    # Default: asyncio
-    return (
+@functools.cache
+def _prompts_dir() -> Traversable:
+    return resources.files("jaunt") / "prompts"
+
+
+@functools.lru_cache(maxsize=64)
+def _load_packaged_prompt(name: str) -> str:
+    return (_prompts_dir() / name).read_text(encoding="utf-8")
+
+
+_ASYNC_TEST_INFO = {
+    "anyio": (
+        "- If a test spec uses `async def`, the generated test MUST also be `async def` "
+        "and decorated with `@pytest.mark.anyio` (import pytest; the anyio pytest plugin "
+        "handles running async tests on the configured backend)."
+    ),
+    "asyncio": (
         "- If a test spec uses `async def`, the generated test MUST also be `async def` "
         "and decorated with `@pytest.mark.asyncio` (import pytest; requires the "
         "pytest-asyncio package)."
-    )
+    ),
+}
+
+
+def async_test_info(async_runner: str) -> str:
+    """Return prompt guidance for async test functions based on the configured runner.
+
+    Unknown runners fall back to the asyncio guidance.
+    """
+    return _ASYNC_TEST_INFO.get(async_runner, _ASYNC_TEST_INFO["asyncio"])
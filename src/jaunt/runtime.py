@@ -11,7 +11,7 @@ import functools
 import importlib
 import inspect
 import os
-from collections.abc import Awaitable, Callable
+from collections.abc import Callable
 from dataclasses import dataclass
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, TypeVar, cast, overload
@@ -49,15 +49,14 @@ def _classify_qualname(obj: object) -> str | None:
     Returns the owning class name for a method (one level of nesting), or
     ``None`` for a top-level definition.  Raises for closures or deeper nesting.
     """
-    o = cast(Any, obj)
-    qualname: str = o.__qualname__ if hasattr(o, "__qualname__") else ""
+    qualname: str = getattr(obj, "__qualname__", "")
     if "<locals>" in qualname:
         raise JauntError("Jaunt specs must not be nested inside functions (closures).")
-    parts = qualname.split(".")
-    if len(parts) == 1:
+    dot = qualname.find(".")
+    if dot < 0:
         return None  # top-level function/class
-    if len(parts) == 2:
-        return parts[0]  # ClassName.method_name → class name
+    if qualname.find(".", dot + 1) < 0:
+        return qualname[:dot]  # ClassName.method_name → class name
     raise JauntError(
         f"Jaunt specs support at most one level of nesting (class methods), got {qualname!r}."
     )
@@ -171,6 +170,23 @@ def _not_built_error(spec_ref: SpecRef) -> JauntNotBuiltError:
     )
 
 
+def _resolve_generated_function(module: str, name: str, spec_ref: SpecRef) -> Any:
+    try:
+        return getattr(_import_generated_module(module), name)
+    except (ModuleNotFoundError, AttributeError):
+        raise _not_built_error(spec_ref) from None
+
+
+def _resolve_generated_method(
+    module: str, class_name: str, method_name: str, spec_ref: SpecRef
+) -> Any:
+    try:
+        gen_cls = getattr(_import_generated_module(module), class_name)
+        return _unwrap_from_class(gen_cls, method_name)
+    except (ModuleNotFoundError, AttributeError, KeyError):
+        raise _not_built_error(spec_ref) from None
+
+
 if TYPE_CHECKING:
     from typing import ParamSpec, Protocol
 
@@ -378,27 +394,20 @@ def magic(
 
         fn = cast(Callable[..., object], obj)
 
+        # Resolve the generated function on every call: a rebuild, reload, or discovery
+        # purge can replace the generated module, and the lookup is a sys.modules hit.
         if inspect.iscoroutinefunction(fn):
 
             @functools.wraps(fn)
             async def _async_wrapper(*args: Any, **kwargs: Any) -> object:
-                try:
-                    mod = _import_generated_module(module)
-                    gen_fn = getattr(mod, name)
-                except (ModuleNotFoundError, AttributeError):
-                    raise _not_built_error(spec_ref) from None
-                return await cast(Callable[..., Awaitable[object]], gen_fn)(*args, **kwargs)
+                gen_fn = _resolve_generated_function(module, name, spec_ref)
+                return await gen_fn(*args, **kwargs)
 
             return _async_wrapper
 
         @functools.wraps(fn)
         def _wrapper(*args: Any, **kwargs: Any) -> object:
-            try:
-                mod = _import_generated_module(module)
-                gen_fn = getattr(mod, name)
-            except (ModuleNotFoundError, AttributeError):
-                raise _not_built_error(spec_ref) from None
-            return cast(Callable[..., object], gen_fn)(*args, **kwargs)
+            return _resolve_generated_function(module, name, spec_ref)(*args, **kwargs)
 
         return _wrapper
 
@@ -526,27 +535,17 @@ def _make_method_wrapper(
 
         @functools.wraps(fn)
         async def _async_method_wrapper(*args: Any, **kwargs: Any) -> object:
-            try:
-                mod = _import_generated_module(module)
-                gen_cls = getattr(mod, class_name)
-                gen_fn = _unwrap_from_class(gen_cls, method_name)
-            except (ModuleNotFoundError, AttributeError, KeyError):
-                raise _not_built_error(spec_ref) from None
+            gen_fn = _resolve_generated_method(module, class_name, method_name, spec_ref)
             # Clear @abstractmethod flag once the implementation is available.
             if getattr(_async_method_wrapper, "__isabstractmethod__", False):
                 object.__setattr__(_async_method_wrapper, "__isabstractmethod__", False)
-            return await cast(Callable[..., Awaitable[object]], gen_fn)(*args, **kwargs)
+            return await gen_fn(*args, **kwargs)
 
         return _async_method_wrapper
 
     @functools.wraps(fn)
     def _method_wrapper(*args: Any, **kwargs: Any) -> object:
-        try:
-            mod = _import_generated_module(module)
-            gen_cls = getattr(mod, class_name)
-            gen_fn = _unwrap_from_class(gen_cls, method_name)
-        except (ModuleNotFoundError, AttributeError, KeyError):
-            raise _not_built_error(spec_ref) from None
+        gen_fn = _resolve_generated_method(module, class_name, method_name, spec_ref)
         # Clear @abstractmethod flag once the implementation is available.
         if getattr(_method_wrapper, "__isabstractmethod__", False):
             object.__setattr__(_method_wrapper, "__isabstractmethod__", False)
@@ -8,6 +8,7 @@ format is:
 
 from __future__ import annotations
 
+import sys
 from collections.abc import Iterable
 from typing import NewType
 
@@ -47,6 +48,9 @@ def normalize_spec_ref(s: str) -> SpecRef:
       ``pkg.mod:Qualname`` using the last dot as the separator.
     - Allow dotted qualnames in colon form, e.g. ``pkg.mod:Outer.Inner``.
     - Raise ``ValueError`` for obviously invalid inputs.
+
+    Results are interned: the same ref is normalized for every registry entry,
+    dependency list and wrapper that mentions it, and they all share one string.
     """
 
     if not isinstance(s, str):
@@ -62,7 +66,7 @@ def normalize_spec_ref(s: str) -> SpecRef:
         module, qualname = raw.split(":", 1)
         if not _is_valid_module(module) or not _is_valid_qualname(qualname):
             raise ValueError("invalid spec ref")
-        return SpecRef(f"{module}:{qualname}")
+        return SpecRef(sys.intern(raw))
 
     # dot shorthand: split on last dot
     if "." not in raw:
@@ -71,7 +75,7 @@ def normalize_spec_ref(s: str) -> SpecRef:
     module, qualname = raw.rsplit(".", 1)
     if not _is_valid_module(module) or not _is_valid_qualname(qualname):
         raise ValueError("invalid spec ref")
-    return SpecRef(f"{module}:{qualname}")
+    return SpecRef(sys.intern(f"{module}:{qualname}"))
 
 
 def spec_ref_from_object(obj: object) -> SpecRef:
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+
+@pytest.fixture
+def missing_import(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Make generated-module imports fail, as they do before `jaunt build`."""
+
+    def _import(name: str) -> Any:
+        raise ModuleNotFoundError(name)
+
+    monkeypatch.setattr("jaunt.runtime.importlib.import_module", _import)
+
+
+@pytest.fixture
+def built_import(monkeypatch: pytest.MonkeyPatch) -> Callable[[str, object], None]:
+    """Return an installer that makes the generated module expose ``qualname`` as ``fn``."""
+
+    def _install(qualname: str, fn: object) -> None:
+        generated = SimpleNamespace(**{qualname: fn})
+        monkeypatch.setattr("jaunt.runtime.importlib.import_module", lambda _name: generated)
+
+    return _install
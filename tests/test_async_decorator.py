@@ -2,19 +2,25 @@
 
 from __future__ import annotations
 
-import asyncio
+import functools
 import inspect
-from collections.abc import Generator
+from collections.abc import Callable, Generator
+from pathlib import Path
 from types import SimpleNamespace
 from typing import Any
 
 import pytest
 
-from jaunt.errors import JauntError, JauntNotBuiltError
-from jaunt.registry import clear_registries, get_magic_registry, get_test_registry
+from jaunt.config import load_config
+from jaunt.digest import extract_source_segment
+from jaunt.errors import JauntConfigError, JauntError, JauntNotBuiltError
+from jaunt.generate.base import ModuleSpecContext
+from jaunt.generate.shared import async_test_info, load_prompt, render_template
+from jaunt.registry import SpecEntry, clear_registries, get_magic_registry, get_test_registry
 from jaunt.runtime import magic
 from jaunt.runtime import test as jaunt_test
 from jaunt.spec_ref import normalize_spec_ref
+from jaunt.validation import validate_generated_source
 
 # --- Top-level async function specs used by tests ---
 
@@ -39,6 +45,12 @@ async def async_test_spec() -> None:
     return None
 
 
+ASYNC_TOP_REF = normalize_spec_ref(
+    f"{async_top_level_fn.__module__}:{async_top_level_fn.__qualname__}"
+)
+ASYNC_TEST_REF = normalize_spec_ref(f"{async_test_spec.__module__}:{async_test_spec.__qualname__}")
+
+
 @pytest.fixture(autouse=True)
 def _clear_registries() -> Generator[None, None, None]:
     clear_registries()
@@ -52,45 +64,21 @@ def _clear_registries() -> Generator[None, None, None]:
 class TestMagicAsyncRegistration:
     """Tests that @magic properly registers async function specs."""
 
-    def test_registers_async_function_spec(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        def _import(_name: str) -> Any:
-            raise ModuleNotFoundError(_name)
-
-        monkeypatch.setattr("jaunt.runtime.importlib.import_module", _import)
-
+    def test_registers_async_function_spec(self, missing_import: None) -> None:
         wrapped = magic()(async_top_level_fn)
         reg = get_magic_registry()
-        expected_ref = normalize_spec_ref(
-            f"{async_top_level_fn.__module__}:{async_top_level_fn.__qualname__}"
-        )
-        assert expected_ref in reg
-        assert reg[expected_ref].kind == "magic"
+        assert ASYNC_TOP_REF in reg
+        assert reg[ASYNC_TOP_REF].kind == "magic"
         assert callable(wrapped)
 
-    def test_async_spec_entry_stores_object(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        def _import(_name: str) -> Any:
-            raise ModuleNotFoundError(_name)
-
-        monkeypatch.setattr("jaunt.runtime.importlib.import_module", _import)
-
+    def test_async_spec_entry_stores_object(self, missing_import: None) -> None:
         magic()(async_top_level_fn)
-        expected_ref = normalize_spec_ref(
-            f"{async_top_level_fn.__module__}:{async_top_level_fn.__qualname__}"
-        )
-        entry = get_magic_registry()[expected_ref]
+        entry = get_magic_registry()[ASYNC_TOP_REF]
         assert entry.obj is async_top_level_fn
 
-    def test_decorator_kwargs_stored_for_async(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        def _import(_name: str) -> Any:
-            raise ModuleNotFoundError(_name)
-
-        monkeypatch.setattr("jaunt.runtime.importlib.import_module", _import)
-
+    def test_decorator_kwargs_stored_for_async(self, missing_import: None) -> None:
         magic(deps="pkg.mod:Dep", prompt="implement async", infer_deps=False)(async_top_level_fn)
-        expected_ref = normalize_spec_ref(
-            f"{async_top_level_fn.__module__}:{async_top_level_fn.__qualname__}"
-        )
-        got = get_magic_registry()[expected_ref]
+        got = get_magic_registry()[ASYNC_TOP_REF]
         assert got.decorator_kwargs == {
             "deps": "pkg.mod:Dep",
             "prompt": "implement async",
@@ -101,62 +89,62 @@ class TestMagicAsyncRegistration:
 class TestMagicAsyncWrapper:
     """Tests that @magic returns async wrappers for async functions."""
 
-    def test_wrapper_is_coroutine_function(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        def _import(_name: str) -> Any:
-            raise ModuleNotFoundError(_name)
-
-        monkeypatch.setattr("jaunt.runtime.importlib.import_module", _import)
-
+    def test_wrapper_is_coroutine_function(self, missing_import: None) -> None:
         wrapped = magic()(async_top_level_fn)
         assert inspect.iscoroutinefunction(wrapped)
 
-    def test_sync_wrapper_is_not_coroutine_function(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        def _import(_name: str) -> Any:
-            raise ModuleNotFoundError(_name)
-
-        monkeypatch.setattr("jaunt.runtime.importlib.import_module", _import)
-
+    def test_sync_wrapper_is_not_coroutine_function(self, missing_import: None) -> None:
         wrapped = magic()(sync_top_level_fn)
         assert not inspect.iscoroutinefunction(wrapped)
 
-    def test_wrapper_preserves_metadata(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        def _import(_name: str) -> Any:
-            raise ModuleNotFoundError(_name)
-
-        monkeypatch.setattr("jaunt.runtime.importlib.import_module", _import)
-
+    def test_wrapper_preserves_metadata(self, missing_import: None) -> None:
         wrapped = magic()(async_top_level_fn)
         assert wrapped.__name__ == async_top_level_fn.__name__
         assert wrapped.__wrapped__ is async_top_level_fn
 
-    def test_wrapper_returns_coroutine(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        def _import(_name: str) -> Any:
-            raise ModuleNotFoundError(_name)
-
-        monkeypatch.setattr("jaunt.runtime.importlib.import_module", _import)
-
+    def test_wrapper_returns_coroutine(self, missing_import: None) -> None:
         wrapped = magic()(async_top_level_fn)
         result = wrapped(42)
         assert inspect.iscoroutine(result)
         # Clean up the coroutine to avoid RuntimeWarning
         result.close()
 
+    def test_wrapper_stays_coroutine_function_when_stacked(self, missing_import: None) -> None:
+        def passthrough(fn: Callable[..., Any]) -> Callable[..., Any]:
+            @functools.wraps(fn)
+            async def shim(*args: Any, **kwargs: Any) -> Any:
+                return await fn(*args, **kwargs)
 
-class TestMagicAsyncUnbuilt:
-    """Tests that unbuilt async @magic specs raise proper errors."""
+            return shim
 
-    def test_unbuilt_async_raises_not_built_error(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        def _import(_name: str) -> Any:
-            raise ModuleNotFoundError(_name)
+        # Another async decorator applied on top of @magic...
+        outer = passthrough(magic()(async_top_level_fn))
+        assert inspect.iscoroutinefunction(outer)
+        assert inspect.unwrap(outer) is async_top_level_fn
 
-        monkeypatch.setattr("jaunt.runtime.importlib.import_module", _import)
+        clear_registries()
+
+        # ...and @magic applied on top of another async decorator.
+        wrapped = magic()(passthrough(async_top_level_fn))
+        assert inspect.iscoroutinefunction(wrapped)
+        assert inspect.unwrap(wrapped) is async_top_level_fn
+        assert ASYNC_TOP_REF in get_magic_registry()
 
+
+class TestMagicAsyncUnbuilt:
+    """Tests that unbuilt async @magic specs raise proper errors."""
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_unbuilt_async_raises_not_built_error(self, missing_import: None) -> None:
         wrapped = magic()(async_top_level_fn)
         with pytest.raises(JauntNotBuiltError) as exc:
-            asyncio.run(wrapped(1))
+            await wrapped(1)
         assert "jaunt build" in str(exc.value)
 
-    def test_unbuilt_async_attribute_error_raises(self, monkeypatch: pytest.MonkeyPatch) -> None:
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_unbuilt_async_attribute_error_raises(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """AttributeError during getattr also raises JauntNotBuiltError."""
 
         def _import(_name: str) -> Any:
@@ -166,62 +154,62 @@ class TestMagicAsyncUnbuilt:
 
         wrapped = magic()(async_top_level_fn)
         with pytest.raises(JauntNotBuiltError):
-            asyncio.run(wrapped(1))
+            await wrapped(1)
 
 
 class TestMagicAsyncBuilt:
     """Tests that built async @magic specs correctly forward to generated code."""
 
-    def test_built_async_forwards_call(self, monkeypatch: pytest.MonkeyPatch) -> None:
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_built_async_forwards_call(
+        self, built_import: Callable[[str, object], None]
+    ) -> None:
         async def gen_fn(x: int) -> int:
             return x + 100
 
-        def _import(_name: str) -> Any:
-            return SimpleNamespace(**{async_top_level_fn.__qualname__: gen_fn})
-
-        monkeypatch.setattr("jaunt.runtime.importlib.import_module", _import)
+        built_import(async_top_level_fn.__qualname__, gen_fn)
 
         wrapped = magic()(async_top_level_fn)
-        result = asyncio.run(wrapped(1))
+        result = await wrapped(1)
         assert result == 101
 
-    def test_built_async_with_string_result(self, monkeypatch: pytest.MonkeyPatch) -> None:
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_built_async_with_string_result(
+        self, built_import: Callable[[str, object], None]
+    ) -> None:
         async def gen_fn(name: str) -> str:
             return f"hello {name}"
 
-        def _import(_name: str) -> Any:
-            return SimpleNamespace(**{another_async_fn.__qualname__: gen_fn})
-
-        monkeypatch.setattr("jaunt.runtime.importlib.import_module", _import)
+        built_import(another_async_fn.__qualname__, gen_fn)
 
         wrapped = magic()(another_async_fn)
-        result = asyncio.run(wrapped("world"))
+        result = await wrapped("world")
         assert result == "hello world"
 
-    def test_built_async_preserves_exception(self, monkeypatch: pytest.MonkeyPatch) -> None:
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_built_async_preserves_exception(
+        self, built_import: Callable[[str, object], None]
+    ) -> None:
         async def gen_fn(x: int) -> int:
             raise ValueError("test error")
 
-        def _import(_name: str) -> Any:
-            return SimpleNamespace(**{async_top_level_fn.__qualname__: gen_fn})
-
-        monkeypatch.setattr("jaunt.runtime.importlib.import_module", _import)
+        built_import(async_top_level_fn.__qualname__, gen_fn)
 
         wrapped = magic()(async_top_level_fn)
         with pytest.raises(ValueError, match="test error"):
-            asyncio.run(wrapped(1))
+            await wrapped(1)
 
-    def test_built_async_passes_kwargs(self, monkeypatch: pytest.MonkeyPatch) -> None:
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_built_async_passes_kwargs(
+        self, built_import: Callable[[str, object], None]
+    ) -> None:
         async def gen_fn(x: int) -> int:
             return x * 2
 
-        def _import(_name: str) -> Any:
-            return SimpleNamespace(**{async_top_level_fn.__qualname__: gen_fn})
-
-        monkeypatch.setattr("jaunt.runtime.importlib.import_module", _import)
+        built_import(async_top_level_fn.__qualname__, gen_fn)
 
         wrapped = magic()(async_top_level_fn)
-        result = asyncio.run(wrapped(x=21))
+        result = await wrapped(x=21)
         assert result == 42
 
 
@@ -237,14 +225,9 @@ class TestMagicAsyncEdgeCases:
         with pytest.raises(JauntError):
             magic()(inner)
 
-    def test_async_and_sync_can_coexist(self, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_async_and_sync_can_coexist(self, missing_import: None) -> None:
         """Both async and sync specs can be registered in the same session."""
 
-        def _import(_name: str) -> Any:
-            raise ModuleNotFoundError(_name)
-
-        monkeypatch.setattr("jaunt.runtime.importlib.import_module", _import)
-
         async_wrapped = magic()(async_top_level_fn)
         sync_wrapped = magic()(sync_top_level_fn)
 
@@ -254,7 +237,8 @@ class TestMagicAsyncEdgeCases:
         reg = get_magic_registry()
         assert len(reg) == 2
 
-    def test_runtime_respects_generated_dir_env_var_for_async(
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_runtime_respects_generated_dir_env_var_for_async(
         self, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         monkeypatch.setenv("JAUNT_GENERATED_DIR", "__custom_gen__")
@@ -269,7 +253,7 @@ class TestMagicAsyncEdgeCases:
 
         wrapped = magic()(async_top_level_fn)
         with pytest.raises(JauntNotBuiltError):
-            asyncio.run(wrapped(1))
+            await wrapped(1)
 
         assert any("__custom_gen__" in c for c in import_calls), (
             f"Expected import to use __custom_gen__, got: {import_calls}"
@@ -288,10 +272,9 @@ class TestTestAsyncRegistration:
         assert callable(fn)
         assert fn.__test__ is False
 
-        expected_ref = normalize_spec_ref(f"{fn.__module__}:{fn.__qualname__}")
         reg = get_test_registry()
-        assert expected_ref in reg
-        assert reg[expected_ref].kind == "test"
+        assert ASYNC_TEST_REF in reg
+        assert reg[ASYNC_TEST_REF].kind == "test"
 
     def test_async_test_spec_preserves_coroutine_nature(self) -> None:
         fn = jaunt_test()(async_test_spec)
@@ -303,76 +286,65 @@ class TestTestAsyncRegistration:
 
     def test_stores_deps_in_decorator_kwargs_for_async(self) -> None:
         jaunt_test(deps=["a.b:One", "a.b:Two"])(async_test_spec)
-        expected_ref = normalize_spec_ref(
-            f"{async_test_spec.__module__}:{async_test_spec.__qualname__}"
-        )
-        got = get_test_registry()[expected_ref]
+        got = get_test_registry()[ASYNC_TEST_REF]
         assert got.decorator_kwargs == {"deps": ["a.b:One", "a.b:Two"]}
 
     def test_async_test_spec_object_is_coroutine_function(self) -> None:
         jaunt_test()(async_test_spec)
-        expected_ref = normalize_spec_ref(
-            f"{async_test_spec.__module__}:{async_test_spec.__qualname__}"
-        )
-        entry = get_test_registry()[expected_ref]
+        entry = get_test_registry()[ASYNC_TEST_REF]
         assert inspect.iscoroutinefunction(entry.obj)
 
 
 # ========================= Config tests =========================
 
 
-class TestAsyncRunnerConfig:
-    """Tests for async_runner configuration."""
+@pytest.fixture(scope="module")
+def config_root(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A project root with `src/`, shared by the config tests; each rewrites jaunt.toml."""
+    root = tmp_path_factory.mktemp("cfg")
+    (root / "src").mkdir()
+    return root
 
-    def test_default_async_runner_is_asyncio(self, tmp_path: Any) -> None:
-        from jaunt.config import load_config
 
-        (tmp_path / "src").mkdir()
-        (tmp_path / "jaunt.toml").write_text("version = 1\n", encoding="utf-8")
-        cfg = load_config(root=tmp_path)
-        assert cfg.build.async_runner == "asyncio"
+@pytest.fixture
+def write_runner_config(config_root: Path) -> Callable[[str | None], Path]:
+    """Return a writer that sets `[build] async_runner` (a TOML literal) in the shared root."""
 
-    def test_async_runner_asyncio_explicit(self, tmp_path: Any) -> None:
-        from jaunt.config import load_config
+    def _write(async_runner: str | None) -> Path:
+        text = "version = 1\n"
+        if async_runner is not None:
+            text += f"[build]\nasync_runner = {async_runner}\n"
+        (config_root / "jaunt.toml").write_text(text, encoding="utf-8")
+        return config_root
 
-        (tmp_path / "src").mkdir()
-        (tmp_path / "jaunt.toml").write_text(
-            'version = 1\n[build]\nasync_runner = "asyncio"\n', encoding="utf-8"
-        )
-        cfg = load_config(root=tmp_path)
-        assert cfg.build.async_runner == "asyncio"
-
-    def test_async_runner_anyio(self, tmp_path: Any) -> None:
-        from jaunt.config import load_config
-
-        (tmp_path / "src").mkdir()
-        (tmp_path / "jaunt.toml").write_text(
-            'version = 1\n[build]\nasync_runner = "anyio"\n', encoding="utf-8"
-        )
-        cfg = load_config(root=tmp_path)
-        assert cfg.build.async_runner == "anyio"
+    return _write
 
-    def test_async_runner_invalid_raises(self, tmp_path: Any) -> None:
-        from jaunt.config import load_config
-        from jaunt.errors import JauntConfigError
 
-        (tmp_path / "src").mkdir()
-        (tmp_path / "jaunt.toml").write_text(
-            'version = 1\n[build]\nasync_runner = "trio"\n', encoding="utf-8"
-        )
-        with pytest.raises(JauntConfigError, match="async_runner"):
-            load_config(root=tmp_path)
-
-    def test_async_runner_invalid_type_raises(self, tmp_path: Any) -> None:
-        from jaunt.config import load_config
-        from jaunt.errors import JauntConfigError
+class TestAsyncRunnerConfig:
+    """Tests for async_runner configuration."""
 
-        (tmp_path / "src").mkdir()
-        (tmp_path / "jaunt.toml").write_text(
-            "version = 1\n[build]\nasync_runner = 42\n", encoding="utf-8"
-        )
-        with pytest.raises(JauntConfigError, match="string"):
-            load_config(root=tmp_path)
+    @pytest.mark.parametrize(
+        ("async_runner", "expected"),
+        [(None, "asyncio"), ('"asyncio"', "asyncio"), ('"anyio"', "anyio")],
+    )
+    def test_async_runner_values(
+        self,
+        write_runner_config: Callable[[str | None], Path],
+        async_runner: str | None,
+        expected: str,
+    ) -> None:
+        cfg = load_config(root=write_runner_config(async_runner))
+        assert cfg.build.async_runner == expected
+
+    @pytest.mark.parametrize(
+        ("async_runner", "match"), [('"trio"', "async_runner"), ("42", "string")]
+    )
+    def test_async_runner_invalid_raises(
+        self, write_runner_config: Callable[[str | None], Path], async_runner: str, match: str
+    ) -> None:
+        root = write_runner_config(async_runner)
+        with pytest.raises(JauntConfigError, match=match):
+            load_config(root=root)
 
 
 # ========================= Validation tests =========================
@@ -382,14 +354,10 @@ class TestAsyncValidation:
     """Tests that validation correctly handles async function definitions."""
 
     def test_validate_async_function_def(self) -> None:
-        from jaunt.validation import validate_generated_source
-
         src = "async def fetch_data():\n    return []\n"
         assert validate_generated_source(src, ["fetch_data"]) == []
 
     def test_validate_multiple_async_and_sync(self) -> None:
-        from jaunt.validation import validate_generated_source
-
         src = (
             "async def fetch_data():\n    return []\n\n"
             "def process_data(data):\n    return data\n\n"
@@ -398,8 +366,6 @@ class TestAsyncValidation:
         assert validate_generated_source(src, ["fetch_data", "process_data", "save_data"]) == []
 
     def test_validate_missing_async_name(self) -> None:
-        from jaunt.validation import validate_generated_source
-
         src = "async def foo():\n    pass\n"
         errs = validate_generated_source(src, ["bar"])
         assert errs
@@ -413,8 +379,6 @@ class TestModuleSpecContextAsyncRunner:
     """Tests that ModuleSpecContext carries async_runner."""
 
     def test_default_async_runner(self) -> None:
-        from jaunt.generate.base import ModuleSpecContext
-
         ctx = ModuleSpecContext(
             kind="build",
             spec_module="pkg.specs",
@@ -428,8 +392,6 @@ class TestModuleSpecContextAsyncRunner:
         assert ctx.async_runner == "asyncio"
 
     def test_custom_async_runner(self) -> None:
-        from jaunt.generate.base import ModuleSpecContext
-
         ctx = ModuleSpecContext(
             kind="test",
             spec_module="pkg.specs",
@@ -450,75 +412,46 @@ class TestModuleSpecContextAsyncRunner:
 class TestAsyncTestInfo:
     """Tests that async_test_info helper returns correct guidance."""
 
-    def test_asyncio_info(self) -> None:
-        from jaunt.generate.shared import async_test_info
-
-        info = async_test_info("asyncio")
-        assert "pytest.mark.asyncio" in info
-        assert "pytest-asyncio" in info
-
-    def test_anyio_info(self) -> None:
-        from jaunt.generate.shared import async_test_info
-
-        info = async_test_info("anyio")
-        assert "pytest.mark.anyio" in info
-        assert "anyio" in info
-
-    def test_default_falls_back_to_asyncio(self) -> None:
-        from jaunt.generate.shared import async_test_info
-
-        info = async_test_info("unknown_runner")
-        assert "pytest.mark.asyncio" in info
+    @pytest.mark.parametrize(
+        ("runner", "needles"),
+        [
+            ("asyncio", ("pytest.mark.asyncio", "pytest-asyncio")),
+            ("anyio", ("pytest.mark.anyio", "anyio")),
+            # Unknown runners fall back to the asyncio guidance.
+            ("unknown_runner", ("pytest.mark.asyncio",)),
+        ],
+    )
+    def test_async_test_info(self, runner: str, needles: tuple[str, ...]) -> None:
+        info = async_test_info(runner)
+        for needle in needles:
+            assert needle in info
 
 
 class TestPromptRendering:
     """Tests that prompts correctly include async test info."""
 
-    def test_build_system_mentions_async(self) -> None:
-        from jaunt.generate.shared import load_prompt
-
-        prompt = load_prompt("build_system.md", None)
-        assert "async def" in prompt
-
-    def test_build_module_mentions_async(self) -> None:
-        from jaunt.generate.shared import load_prompt
-
-        prompt = load_prompt("build_module.md", None)
-        assert "async def" in prompt
-
-    def test_test_system_has_async_test_info_placeholder(self) -> None:
-        from jaunt.generate.shared import load_prompt
-
-        prompt = load_prompt("test_system.md", None)
-        assert "{{async_test_info}}" in prompt
-
-    def test_test_module_has_async_test_info_placeholder(self) -> None:
-        from jaunt.generate.shared import load_prompt
-
-        prompt = load_prompt("test_module.md", None)
-        assert "{{async_test_info}}" in prompt
-
-    def test_rendered_test_prompt_includes_asyncio_marker(
-        self, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        from jaunt.generate.shared import async_test_info, load_prompt, render_template
-
+    @pytest.mark.parametrize(
+        ("filename", "needle"),
+        [
+            ("build_system.md", "async def"),
+            ("build_module.md", "async def"),
+            ("test_system.md", "{{async_test_info}}"),
+            ("test_module.md", "{{async_test_info}}"),
+        ],
+    )
+    def test_packaged_prompt_covers_async(self, filename: str, needle: str) -> None:
+        assert needle in load_prompt(filename, None)
+
+    @pytest.mark.parametrize(
+        ("runner", "marker"),
+        [("asyncio", "pytest.mark.asyncio"), ("anyio", "pytest.mark.anyio")],
+    )
+    def test_rendered_test_prompt_includes_runner_marker(self, runner: str, marker: str) -> None:
         rendered = render_template(
             load_prompt("test_module.md", None),
-            {"async_test_info": async_test_info("asyncio")},
+            {"async_test_info": async_test_info(runner)},
         )
-        assert "pytest.mark.asyncio" in rendered
-
-    def test_rendered_test_prompt_includes_anyio_marker(
-        self, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        from jaunt.generate.shared import async_test_info, load_prompt, render_template
-
-        rendered = render_template(
-            load_prompt("test_module.md", None),
-            {"async_test_info": async_test_info("anyio")},
-        )
-        assert "pytest.mark.anyio" in rendered
+        assert marker in rendered
 
 
 # ========================= Digest / dependency tests =========================
@@ -528,10 +461,6 @@ class TestAsyncDigest:
     """Tests that digest extraction works for async functions."""
 
     def test_extract_source_segment_for_async(self, tmp_path: Any) -> None:
-        from jaunt.digest import extract_source_segment
-        from jaunt.registry import SpecEntry
-        from jaunt.spec_ref import normalize_spec_ref
-
         src = 'async def fetch(url: str) -> str:\n    """Fetch a URL."""\n    ...\n'
         f = tmp_path / "specs.py"
         f.write_text(src, encoding="utf-8")
@@ -1,7 +1,34 @@
 from __future__ import annotations
 
+import importlib.metadata
+
+import pytest
+
 import jaunt
 
 
 def test_version_is_string() -> None:
     assert isinstance(jaunt.__version__, str)
+
+
+def test_unknown_attribute_raises() -> None:
+    with pytest.raises(AttributeError):
+        jaunt.not_an_attribute  # noqa: B018
+
+
+def test_version_is_resolved_lazily_and_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str] = []
+
+    def _version(name: str) -> str:
+        calls.append(name)
+        return "9.9.9"
+
+    monkeypatch.setattr(importlib.metadata, "version", _version)
+    jaunt._package_version.cache_clear()
+    try:
+        assert "__version__" not in vars(jaunt)
+        assert jaunt.__version__ == "9.9.9"
+        assert jaunt.__version__ == "9.9.9"
+        assert calls == ["jaunt"]
+    finally:
+        jaunt._package_version.cache_clear()
@@ -19,6 +19,13 @@ from jaunt.progress import ProgressBar
 from jaunt.registry import SpecEntry
 from jaunt.spec_ref import normalize_spec_ref
 
+# The scheduler tests share one event loop per module. The few synchronous tests in
+# this file would otherwise warn about carrying the module-level asyncio mark.
+pytestmark = [
+    pytest.mark.asyncio(loop_scope="module"),
+    pytest.mark.filterwarnings("ignore:.*is marked with '@pytest.mark.asyncio' but it is not"),
+]
+
 
 def _write(path: Path, text: str) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
@@ -28,9 +35,6 @@ def _write(path: Path, text: str) -> None:
 def _entry(
     *, module: str, qualname: str, source_file: str, deps: list[str] | None = None
 ) -> SpecEntry:
-    kw: dict[str, object] = {}
-    if deps is not None:
-        kw["deps"] = deps
     return SpecEntry(
         kind="magic",
         spec_ref=normalize_spec_ref(f"{module}:{qualname}"),
@@ -38,7 +42,7 @@ def _entry(
         qualname=qualname,
         source_file=source_file,
         obj=object(),
-        decorator_kwargs=kw,
+        decorator_kwargs={} if deps is None else {"deps": deps},
     )
 
 
@@ -52,10 +56,10 @@ class FakeBackend(GeneratorBackend):
     ) -> tuple[str, None]:
         self.calls.append(ctx.spec_module)
         self.contexts.append(ctx)
-        lines: list[str] = []
-        for name in ctx.expected_names:
-            lines.append(f"def {name}():\n    return {name!r}\n")
-        return "\n".join(lines).rstrip() + "\n", None
+        # Each def already ends in a newline, so joining on "\n" leaves one blank line
+        # between them and no trailing whitespace to strip.
+        source = "\n".join(f"def {name}():\n    return {name!r}\n" for name in ctx.expected_names)
+        return source, None
 
 
 class SourceBackend(GeneratorBackend):
@@ -107,7 +111,7 @@ def test_expand_stale_modules_without_allowed_modules_keeps_existing_behavior()
     assert expanded == {"pkg.dep", "pkg.mid", "pkg.target", "pkg.other"}
 
 
-def test_scheduler_respects_dependency_order_jobs_1(tmp_path: Path) -> None:
+async def test_scheduler_respects_dependency_order_jobs_1(tmp_path: Path) -> None:
     src = tmp_path / "src"
 
     # Two modules: a depends on nothing; b depends on a.
@@ -126,18 +130,16 @@ def test_scheduler_respects_dependency_order_jobs_1(tmp_path: Path) -> None:
     module_dag = {"pkg.a": set(), "pkg.b": {"pkg.a"}}
 
     backend = FakeBackend()
-    report = asyncio.run(
-        run_build(
-            package_dir=src,
-            generated_dir="__generated__",
-            module_specs=module_specs,
-            specs=specs,
-            spec_graph=spec_graph,
-            module_dag=module_dag,
-            stale_modules=set(module_specs.keys()),
-            backend=backend,
-            jobs=1,
-        )
+    report = await run_build(
+        package_dir=src,
+        generated_dir="__generated__",
+        module_specs=module_specs,
+        specs=specs,
+        spec_graph=spec_graph,
+        module_dag=module_dag,
+        stale_modules=set(module_specs.keys()),
+        backend=backend,
+        jobs=1,
     )
 
     assert report.failed == {}
@@ -145,7 +147,60 @@ def test_scheduler_respects_dependency_order_jobs_1(tmp_path: Path) -> None:
     assert backend.calls == ["pkg.a", "pkg.b"]
 
 
-def test_dependents_rebuild_only_when_changed_module_api_changes(tmp_path: Path) -> None:
+class SlowBackend(FakeBackend):
+    """Fake backend whose calls take a little while and record how many overlap."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def generate_module(
+        self, ctx: ModuleSpecContext, *, extra_error_context: list[str] | None = None
+    ) -> tuple[str, None]:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.05)
+            return await super().generate_module(ctx, extra_error_context=extra_error_context)
+        finally:
+            self.in_flight -= 1
+
+
+async def test_scheduler_runs_independent_modules_concurrently(tmp_path: Path) -> None:
+    src = tmp_path / "src"
+
+    entries = []
+    for name in ("a", "b", "c", "d"):
+        path = tmp_path / f"{name}.py"
+        _write(path, f"def {name.upper()}():\n    return 1\n")
+        entries.append(_entry(module=f"pkg.{name}", qualname=name.upper(), source_file=str(path)))
+
+    specs = {e.spec_ref: e for e in entries}
+    spec_graph = build_spec_graph(specs, infer_default=False)
+    module_specs = {e.module: [e] for e in entries}
+    module_dag: dict[str, set[str]] = {e.module: set() for e in entries}
+
+    backend = SlowBackend()
+    report = await run_build(
+        package_dir=src,
+        generated_dir="__generated__",
+        module_specs=module_specs,
+        specs=specs,
+        spec_graph=spec_graph,
+        module_dag=module_dag,
+        stale_modules=set(module_specs),
+        backend=backend,
+        jobs=4,
+    )
+
+    assert report.failed == {}
+    assert report.generated == set(module_specs)
+    # All four independent modules were generating at the same time.
+    assert backend.max_in_flight == 4
+
+
+async def test_dependents_rebuild_only_when_changed_module_api_changes(tmp_path: Path) -> None:
     src = tmp_path / "src"
 
     a_path = tmp_path / "a.py"
@@ -161,19 +216,17 @@ def test_dependents_rebuild_only_when_changed_module_api_changes(tmp_path: Path)
     module_dag = {"pkg.a": set(), "pkg.b": {"pkg.a"}}
 
     backend = FakeBackend()
-    report = asyncio.run(
-        run_build(
-            package_dir=src,
-            generated_dir="__generated__",
-            module_specs=module_specs,
-            specs=specs,
-            spec_graph=spec_graph,
-            module_dag=module_dag,
-            stale_modules={"pkg.a"},
-            changed_modules=set(),
-            backend=backend,
-            jobs=2,
-        )
+    report = await run_build(
+        package_dir=src,
+        generated_dir="__generated__",
+        module_specs=module_specs,
+        specs=specs,
+        spec_graph=spec_graph,
+        module_dag=module_dag,
+        stale_modules={"pkg.a"},
+        changed_modules=set(),
+        backend=backend,
+        jobs=2,
     )
 
     assert report.failed == {}
@@ -181,7 +234,7 @@ def test_dependents_rebuild_only_when_changed_module_api_changes(tmp_path: Path)
     assert backend.calls == ["pkg.a"]
 
 
-def test_run_build_allowed_modules_skips_out_of_closure_dependents(tmp_path: Path) -> None:
+async def test_run_build_allowed_modules_skips_out_of_closure_dependents(tmp_path: Path) -> None:
     src = tmp_path / "src"
 
     dep_path = tmp_path / "dep.py"
@@ -211,20 +264,18 @@ def test_run_build_allowed_modules_skips_out_of_closure_dependents(tmp_path: Pat
     module_dag = {"pkg.dep": set(), "pkg.target": {"pkg.dep"}, "pkg.other": {"pkg.dep"}}
 
     backend = FakeBackend()
-    report = asyncio.run(
-        run_build(
-            package_dir=src,
-            generated_dir="__generated__",
-            module_specs=module_specs,
-            specs=specs,
-            spec_graph=spec_graph,
-            module_dag=module_dag,
-            stale_modules={"pkg.dep"},
-            changed_modules={"pkg.dep"},
-            allowed_modules={"pkg.dep", "pkg.target"},
-            backend=backend,
-            jobs=2,
-        )
+    report = await run_build(
+        package_dir=src,
+        generated_dir="__generated__",
+        module_specs=module_specs,
+        specs=specs,
+        spec_graph=spec_graph,
+        module_dag=module_dag,
+        stale_modules={"pkg.dep"},
+        changed_modules={"pkg.dep"},
+        allowed_modules={"pkg.dep", "pkg.target"},
+        backend=backend,
+        jobs=2,
     )
 
     assert report.failed == {}
@@ -233,7 +284,7 @@ def test_run_build_allowed_modules_skips_out_of_closure_dependents(tmp_path: Pat
     assert "pkg.other" not in backend.calls
 
 
-def test_run_build_rejects_undeclared_generated_import(tmp_path: Path) -> None:
+async def test_run_build_rejects_undeclared_generated_import(tmp_path: Path) -> None:
     src = tmp_path / "src"
     spec_path = tmp_path / "specs.py"
     _write(spec_path, "def Play():\n    return 1\n")
@@ -243,20 +294,18 @@ def test_run_build_rejects_undeclared_generated_import(tmp_path: Path) -> None:
     module_specs = {"pkg.specs": [entry]}
     module_dag = {"pkg.specs": set()}
 
-    report = asyncio.run(
-        run_build(
-            package_dir=src,
-            generated_dir="__generated__",
-            module_specs=module_specs,
-            specs=specs,
-            spec_graph=spec_graph,
-            module_dag=module_dag,
-            stale_modules={"pkg.specs"},
-            backend=SourceBackend(
-                "import hallucinated_pkg\n\ndef Play():\n    return hallucinated_pkg.VALUE\n"
-            ),
-            jobs=1,
-        )
+    report = await run_build(
+        package_dir=src,
+        generated_dir="__generated__",
+        module_specs=module_specs,
+        specs=specs,
+        spec_graph=spec_graph,
+        module_dag=module_dag,
+        stale_modules={"pkg.specs"},
+        backend=SourceBackend(
+            "import hallucinated_pkg\n\ndef Play():\n    return hallucinated_pkg.VALUE\n"
+        ),
+        jobs=1,
     )
 
     assert report.generated == set()
@@ -266,7 +315,7 @@ def test_run_build_rejects_undeclared_generated_import(tmp_path: Path) -> None:
     assert "pkg.__generated__.specs" in joined
 
 
-def test_run_build_accepts_first_party_import_from_second_source_root(tmp_path: Path) -> None:
+async def test_run_build_accepts_first_party_import_from_second_source_root(tmp_path: Path) -> None:
     src = tmp_path / "src"
     helpers = tmp_path / "helpers.py"
     spec_path = tmp_path / "specs.py"
@@ -278,26 +327,24 @@ def test_run_build_accepts_first_party_import_from_second_source_root(tmp_path:
     module_specs = {"pkg.specs": [entry]}
     module_dag = {"pkg.specs": set()}
 
-    report = asyncio.run(
-        run_build(
-            package_dir=src,
-            generated_dir="__generated__",
-            module_specs=module_specs,
-            specs=specs,
-            spec_graph=spec_graph,
-            module_dag=module_dag,
-            stale_modules={"pkg.specs"},
-            backend=SourceBackend("import helpers\n\ndef Play():\n    return helpers.helper()\n"),
-            source_roots=[src, tmp_path],
-            jobs=1,
-        )
+    report = await run_build(
+        package_dir=src,
+        generated_dir="__generated__",
+        module_specs=module_specs,
+        specs=specs,
+        spec_graph=spec_graph,
+        module_dag=module_dag,
+        stale_modules={"pkg.specs"},
+        backend=SourceBackend("import helpers\n\ndef Play():\n    return helpers.helper()\n"),
+        source_roots=[src, tmp_path],
+        jobs=1,
     )
 
     assert report.failed == {}
     assert report.generated == {"pkg.specs"}
 
 
-def test_needs_dep_marker_surfaces_as_build_warning(tmp_path: Path) -> None:
+async def test_needs_dep_marker_surfaces_as_build_warning(tmp_path: Path) -> None:
     src = tmp_path / "src"
     spec_path = tmp_path / "specs.py"
     _write(spec_path, "def Play():\n    return 1\n")
@@ -312,18 +359,16 @@ def test_needs_dep_marker_surfaces_as_build_warning(tmp_path: Path) -> None:
         "    # JAUNT-NEEDS-DEP: util.hashing:stable_hash — inlined a copy\n"
         "    return 1\n"
     )
-    report = asyncio.run(
-        run_build(
-            package_dir=src,
-            generated_dir="__generated__",
-            module_specs=module_specs,
-            specs=specs,
-            spec_graph=spec_graph,
-            module_dag=module_dag,
-            stale_modules={"pkg.specs"},
-            backend=SourceBackend(source),
-            jobs=1,
-        )
+    report = await run_build(
+        package_dir=src,
+        generated_dir="__generated__",
+        module_specs=module_specs,
+        specs=specs,
+        spec_graph=spec_graph,
+        module_dag=module_dag,
+        stale_modules={"pkg.specs"},
+        backend=SourceBackend(source),
+        jobs=1,
     )
 
     assert report.generated == {"pkg.specs"}
@@ -332,7 +377,7 @@ def test_needs_dep_marker_surfaces_as_build_warning(tmp_path: Path) -> None:
     assert any("util.hashing:stable_hash" in m for m in markers)
 
 
-def test_no_needs_dep_marker_leaves_needs_deps_empty(tmp_path: Path) -> None:
+async def test_no_needs_dep_marker_leaves_needs_deps_empty(tmp_path: Path) -> None:
     src = tmp_path / "src"
     spec_path = tmp_path / "specs.py"
     _write(spec_path, "def Play():\n    return 1\n")
@@ -342,18 +387,16 @@ def test_no_needs_dep_marker_leaves_needs_deps_empty(tmp_path: Path) -> None:
     module_specs = {"pkg.specs": [entry]}
     module_dag = {"pkg.specs": set()}
 
-    report = asyncio.run(
-        run_build(
-            package_dir=src,
-            generated_dir="__generated__",
-            module_specs=module_specs,
-            specs=specs,
-            spec_graph=spec_graph,
-            module_dag=module_dag,
-            stale_modules={"pkg.specs"},
-            backend=SourceBackend("def Play():\n    return 1\n"),
-            jobs=1,
-        )
+    report = await run_build(
+        package_dir=src,
+        generated_dir="__generated__",
+        module_specs=module_specs,
+        specs=specs,
+        spec_graph=spec_graph,
+        module_dag=module_dag,
+        stale_modules={"pkg.specs"},
+        backend=SourceBackend("def Play():\n    return 1\n"),
+        jobs=1,
     )
 
     assert report.generated == {"pkg.specs"}
@@ -372,7 +415,7 @@ _CONTEXT_BLOCKS = (
 )
 
 
-def test_context_stats_populated_for_built_module(tmp_path: Path) -> None:
+async def test_context_stats_populated_for_built_module(tmp_path: Path) -> None:
     src = tmp_path / "src"
     spec_path = tmp_path / "specs.py"
     _write(spec_path, "def Play():\n    return 1\n")
@@ -382,19 +425,17 @@ def test_context_stats_populated_for_built_module(tmp_path: Path) -> None:
     module_specs = {"pkg.specs": [entry]}
     module_dag = {"pkg.specs": set()}
 
-    report = asyncio.run(
-        run_build(
-            package_dir=src,
-            generated_dir="__generated__",
-            module_specs=module_specs,
-            specs=specs,
-            spec_graph=spec_graph,
-            module_dag=module_dag,
-            stale_modules={"pkg.specs"},
-            backend=SourceBackend("def Play():\n    return 1\n"),
-            repo_map_block="R" * 40,
-            jobs=1,
-        )
+    report = await run_build(
+        package_dir=src,
+        generated_dir="__generated__",
+        module_specs=module_specs,
+        specs=specs,
+        spec_graph=spec_graph,
+        module_dag=module_dag,
+        stale_modules={"pkg.specs"},
+        backend=SourceBackend("def Play():\n    return 1\n"),
+        repo_map_block="R" * 40,
+        jobs=1,
     )
 
     assert report.generated == {"pkg.specs"}
@@ -412,7 +453,7 @@ def test_context_stats_populated_for_built_module(tmp_path: Path) -> None:
     assert blocks["preamble"]["chars"] > 0
 
 
-def test_context_stats_only_for_generated_modules(tmp_path: Path) -> None:
+async def test_context_stats_only_for_generated_modules(tmp_path: Path) -> None:
     src = tmp_path / "src"
     a_path = tmp_path / "a.py"
     b_path = tmp_path / "b.py"
@@ -425,18 +466,16 @@ def test_context_stats_only_for_generated_modules(tmp_path: Path) -> None:
     module_specs = {"pkg.a": [ea], "pkg.b": [eb]}
     module_dag = {"pkg.a": set(), "pkg.b": set()}
 
-    report = asyncio.run(
-        run_build(
-            package_dir=src,
-            generated_dir="__generated__",
-            module_specs=module_specs,
-            specs=specs,
-            spec_graph=spec_graph,
-            module_dag=module_dag,
-            stale_modules={"pkg.a"},
-            backend=SourceBackend("def A():\n    return 1\n"),
-            jobs=1,
-        )
+    report = await run_build(
+        package_dir=src,
+        generated_dir="__generated__",
+        module_specs=module_specs,
+        specs=specs,
+        spec_graph=spec_graph,
+        module_dag=module_dag,
+        stale_modules={"pkg.a"},
+        backend=SourceBackend("def A():\n    return 1\n"),
+        jobs=1,
     )
 
     assert report.generated == {"pkg.a"}
@@ -457,22 +496,20 @@ def _single_spec_project(tmp_path: Path):
     return src, spec_path, specs, spec_graph, module_specs, module_dag
 
 
-def _project_with_stale_managed_stub(tmp_path: Path):
+async def _project_with_stale_managed_stub(tmp_path: Path):
     project = _single_spec_project(tmp_path)
     src, spec_path, specs, spec_graph, module_specs, module_dag = project
-    first = asyncio.run(
-        run_build(
-            package_dir=src,
-            generated_dir="__generated__",
-            module_specs=module_specs,
-            specs=specs,
-            spec_graph=spec_graph,
-            module_dag=module_dag,
-            stale_modules={"pkg.specs"},
-            backend=SourceBackend("def Play(x: int) -> int:\n    return x * 2\n"),
-            jobs=1,
-            emit_stubs=True,
-        )
+    first = await run_build(
+        package_dir=src,
+        generated_dir="__generated__",
+        module_specs=module_specs,
+        specs=specs,
+        spec_graph=spec_graph,
+        module_dag=module_dag,
+        stale_modules={"pkg.specs"},
+        backend=SourceBackend("def Play(x: int) -> int:\n    return x * 2\n"),
+        jobs=1,
+        emit_stubs=True,
     )
     assert first.failed == {}
     stub_path = spec_path.with_suffix(".pyi")
@@ -481,23 +518,21 @@ def _project_with_stale_managed_stub(tmp_path: Path):
     return project, stub_path, stale_bytes
 
 
-def test_run_build_emits_pyi_stub(tmp_path: Path) -> None:
+async def test_run_build_emits_pyi_stub(tmp_path: Path) -> None:
     from jaunt.stub_emitter import is_jaunt_stub
 
     src, spec_path, specs, spec_graph, module_specs, module_dag = _single_spec_project(tmp_path)
-    report = asyncio.run(
-        run_build(
-            package_dir=src,
-            generated_dir="__generated__",
-            module_specs=module_specs,
-            specs=specs,
-            spec_graph=spec_graph,
-            module_dag=module_dag,
-            stale_modules={"pkg.specs"},
-            backend=SourceBackend("def Play(x: int) -> int:\n    return x * 2\n"),
-            jobs=1,
-            emit_stubs=True,
-        )
+    report = await run_build(
+        package_dir=src,
+        generated_dir="__generated__",
+        module_specs=module_specs,
+        specs=specs,
+        spec_graph=spec_graph,
+        module_dag=module_dag,
+        stale_modules={"pkg.specs"},
+        backend=SourceBackend("def Play(x: int) -> int:\n    return x * 2\n"),
+        jobs=1,
+        emit_stubs=True,
     )
     assert report.generated == {"pkg.specs"}
     stub_path = spec_path.with_suffix(".pyi")
@@ -509,25 +544,23 @@ def test_run_build_emits_pyi_stub(tmp_path: Path) -> None:
     assert report.emitted_stubs.get("pkg.specs") == str(stub_path)
 
 
-def test_run_build_fails_when_emitted_stub_does_not_converge(
+async def test_run_build_fails_when_emitted_stub_does_not_converge(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
     src, _spec_path, specs, spec_graph, module_specs, module_dag = _single_spec_project(tmp_path)
     monkeypatch.setattr("jaunt.stub_emitter.stub_staleness", lambda **_kwargs: "stale")
 
-    report = asyncio.run(
-        run_build(
-            package_dir=src,
-            generated_dir="__generated__",
-            module_specs=module_specs,
-            specs=specs,
-            spec_graph=spec_graph,
-            module_dag=module_dag,
-            stale_modules={"pkg.specs"},
-            backend=SourceBackend("def Play(x: int) -> int:\n    return x * 2\n"),
-            jobs=1,
-            emit_stubs=True,
-        )
+    report = await run_build(
+        package_dir=src,
+        generated_dir="__generated__",
+        module_specs=module_specs,
+        specs=specs,
+        spec_graph=spec_graph,
+        module_dag=module_dag,
+        stale_modules={"pkg.specs"},
+        backend=SourceBackend("def Play(x: int) -> int:\n    return x * 2\n"),
+        jobs=1,
+        emit_stubs=True,
     )
 
     assert report.generated == set()
@@ -536,7 +569,7 @@ def test_run_build_fails_when_emitted_stub_does_not_converge(
     assert "pkg.specs" not in report.emitted_stubs
 
 
-def test_run_build_reemits_stub_when_generated_module_changes_after_publish(
+async def test_run_build_reemits_stub_when_generated_module_changes_after_publish(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
     from jaunt import builder as builder_module
@@ -566,19 +599,17 @@ def test_run_build_reemits_stub_when_generated_module_changes_after_publish(
 
     monkeypatch.setattr(builder_module.os, "link", link_with_concurrent_generated_update)
 
-    report = asyncio.run(
-        run_build(
-            package_dir=src,
-            generated_dir="__generated__",
-            module_specs=module_specs,
-            specs=specs,
-            spec_graph=spec_graph,
-            module_dag=module_dag,
-            stale_modules={"pkg.specs"},
-            backend=SourceBackend("def Play(x: int) -> int:\n    return x * 2\n"),
-            jobs=1,
-            emit_stubs=True,
-        )
+    report = await run_build(
+        package_dir=src,
+        generated_dir="__generated__",
+        module_specs=module_specs,
+        specs=specs,
+        spec_graph=spec_graph,
+        module_dag=module_dag,
+        stale_modules={"pkg.specs"},
+        backend=SourceBackend("def Play(x: int) -> int:\n    return x * 2\n"),
+        jobs=1,
+        emit_stubs=True,
     )
 
     assert replaced_generated is True
@@ -595,7 +626,7 @@ def test_run_build_reemits_stub_when_generated_module_changes_after_publish(
     )
 
 
-def test_run_build_preserves_hand_authored_stub_created_during_formatting(
+async def test_run_build_preserves_hand_authored_stub_created_during_formatting(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
     from jaunt import stub_emitter
@@ -616,19 +647,17 @@ def test_run_build_preserves_hand_authored_stub_created_during_formatting(
 
     monkeypatch.setattr(stub_emitter, "format_stub_best_effort", format_after_user_write)
 
-    report = asyncio.run(
-        run_build(
-            package_dir=src,
-            generated_dir="__generated__",
-            module_specs=module_specs,
-            specs=specs,
-            spec_graph=spec_graph,
-            module_dag=module_dag,
-            stale_modules={"pkg.specs"},
-            backend=SourceBackend("def Play(x: int) -> int:\n    return x * 2\n"),
-            jobs=1,
-            emit_stubs=True,
-        )
+    report = await run_build(
+        package_dir=src,
+        generated_dir="__generated__",
+        module_specs=module_specs,
+        specs=specs,
+        spec_graph=spec_graph,
+        module_dag=module_dag,
+        stale_modules={"pkg.specs"},
+        backend=SourceBackend("def Play(x: int) -> int:\n    return x * 2\n"),
+        jobs=1,
+        emit_stubs=True,
     )
 
     assert created_stub is True
@@ -641,7 +670,7 @@ def test_run_build_preserves_hand_authored_stub_created_during_formatting(
     )
 
 
-def test_run_build_does_not_clobber_absent_stub_created_at_publish_boundary(
+async def test_run_build_does_not_clobber_absent_stub_created_at_publish_boundary(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
     from jaunt import builder as builder_module
@@ -661,19 +690,17 @@ def test_run_build_does_not_clobber_absent_stub_created_at_publish_boundary(
 
     monkeypatch.setattr(builder_module.os, "link", link_after_external_create)
 
-    report = asyncio.run(
-        run_build(
-            package_dir=src,
-            generated_dir="__generated__",
-            module_specs=module_specs,
-            specs=specs,
-            spec_graph=spec_graph,
-            module_dag=module_dag,
-            stale_modules={"pkg.specs"},
-            backend=SourceBackend("def Play(x: int) -> int:\n    return x * 2\n"),
-            jobs=1,
-            emit_stubs=True,
-        )
+    report = await run_build(
+        package_dir=src,
+        generated_dir="__generated__",
+        module_specs=module_specs,
+        specs=specs,
+        spec_graph=spec_graph,
+        module_dag=module_dag,
+        stale_modules={"pkg.specs"},
+        backend=SourceBackend("def Play(x: int) -> int:\n    return x * 2\n"),
+        jobs=1,
+        emit_stubs=True,
     )
 
     assert created_stub is True
@@ -684,7 +711,7 @@ def test_run_build_does_not_clobber_absent_stub_created_at_publish_boundary(
     assert any("hand-authored specs.pyi not overwritten" in item for item in report.stub_warnings)
 
 
-def test_run_build_publishes_new_stub_when_hardlinks_are_unavailable(
+async def test_run_build_publishes_new_stub_when_hardlinks_are_unavailable(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
     from jaunt import builder as builder_module
@@ -701,19 +728,17 @@ def test_run_build_publishes_new_stub_when_hardlinks_are_unavailable(
 
     monkeypatch.setattr(builder_module.os, "link", reject_stub_hardlinks)
 
-    report = asyncio.run(
-        run_build(
-            package_dir=src,
-            generated_dir="__generated__",
-            module_specs=module_specs,
-            specs=specs,
-            spec_graph=spec_graph,
-            module_dag=module_dag,
-            stale_modules={"pkg.specs"},
-            backend=SourceBackend("def Play(x: int) -> int:\n    return x * 2\n"),
-            jobs=1,
-            emit_stubs=True,
-        )
+    report = await run_build(
+        package_dir=src,
+        generated_dir="__generated__",
+        module_specs=module_specs,
+        specs=specs,
+        spec_graph=spec_graph,
+        module_dag=module_dag,
+        stale_modules={"pkg.specs"},
+        backend=SourceBackend("def Play(x: int) -> int:\n    return x * 2\n"),
+        jobs=1,
+        emit_stubs=True,
     )
 
     assert report.generated == {"pkg.specs"}
@@ -731,7 +756,7 @@ def test_run_build_publishes_new_stub_when_hardlinks_are_unavailable(
     assert list(stub_path.parent.glob(".jaunt-stub-candidate-*")) == []
 
 
-def test_run_build_hardlink_fallback_preserves_absent_stub_create_race(
+async def test_run_build_hardlink_fallback_preserves_absent_stub_create_race(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
     from jaunt import builder as builder_module
@@ -758,19 +783,17 @@ def test_run_build_hardlink_fallback_preserves_absent_stub_create_race(
     monkeypatch.setattr(builder_module.os, "link", reject_stub_hardlinks)
     monkeypatch.setattr(builder_module.os, "open", create_before_exclusive_open)
 
-    report = asyncio.run(
-        run_build(
-            package_dir=src,
-            generated_dir="__generated__",
-            module_specs=module_specs,
-            specs=specs,
-            spec_graph=spec_graph,
-            module_dag=module_dag,
-            stale_modules={"pkg.specs"},
-            backend=SourceBackend("def Play(x: int) -> int:\n    return x * 2\n"),
-            jobs=1,
-            emit_stubs=True,
-        )
+    report = await run_build(
+        package_dir=src,
+        generated_dir="__generated__",
+        module_specs=module_specs,
+        specs=specs,
+        spec_graph=spec_graph,
+        module_dag=module_dag,
+        stale_modules={"pkg.specs"},
+        backend=SourceBackend("def Play(x: int) -> int:\n    return x * 2\n"),
+        jobs=1,
+        emit_stubs=True,
     )
 
     assert created_stub is True
@@ -784,7 +807,7 @@ def test_run_build_hardlink_fallback_preserves_absent_stub_create_race(
 
 
 @pytest.mark.parametrize("fault", ["write", "fsync", "close"])
-def test_run_build_hardlink_fallback_removes_failed_public_copy(
+async def test_run_build_hardlink_fallback_removes_failed_public_copy(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch, fault: str
 ) -> None:
     from jaunt import builder as builder_module
@@ -840,19 +863,17 @@ def test_run_build_hardlink_fallback_removes_failed_public_copy(
     monkeypatch.setattr(builder_module.os, "fsync", fail_public_fsync)
     monkeypatch.setattr(builder_module.os, "close", fail_public_close)
 
-    report = asyncio.run(
-        run_build(
-            package_dir=src,
-            generated_dir="__generated__",
-            module_specs=module_specs,
-            specs=specs,
-            spec_graph=spec_graph,
-            module_dag=module_dag,
-            stale_modules={"pkg.specs"},
-            backend=SourceBackend("def Play(x: int) -> int:\n    return x * 2\n"),
-            jobs=1,
-            emit_stubs=True,
-        )
+    report = await run_build(
+        package_dir=src,
+        generated_dir="__generated__",
+        module_specs=module_specs,
+        specs=specs,
+        spec_graph=spec_graph,
+        module_dag=module_dag,
+        stale_modules={"pkg.specs"},
+        backend=SourceBackend("def Play(x: int) -> int:\n    return x * 2\n"),
+        jobs=1,
+        emit_stubs=True,
     )
 
     assert "pkg.specs" in report.failed
@@ -862,7 +883,7 @@ def test_run_build_hardlink_fallback_removes_failed_public_copy(
     assert list(stub_path.parent.glob(".jaunt-stub-candidate-*")) == []
 
 
-def test_run_build_hardlink_fallback_accepts_positive_short_writes(
+async def test_run_build_hardlink_fallback_accepts_positive_short_writes(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
     from jaunt import builder as builder_module
@@ -899,19 +920,17 @@ def test_run_build_hardlink_fallback_accepts_positive_short_writes(
     monkeypatch.setattr(builder_module.os, "open", track_public_open)
     monkeypatch.setattr(builder_module.os, "write", short_public_write)
 
-    report = asyncio.run(
-        run_build(
-            package_dir=src,
-            generated_dir="__generated__",
-            module_specs=module_specs,
-            specs=specs,
-            spec_graph=spec_graph,
-            module_dag=module_dag,
-            stale_modules={"pkg.specs"},
-            backend=SourceBackend("def Play(x: int) -> int:\n    return x * 2\n"),
-            jobs=1,
-            emit_stubs=True,
-        )
+    report = await run_build(
+        package_dir=src,
+        generated_dir="__generated__",
+        module_specs=module_specs,
+        specs=specs,
+        spec_graph=spec_graph,
+        module_dag=module_dag,
+        stale_modules={"pkg.specs"},
+        backend=SourceBackend("def Play(x: int) -> int:\n    return x * 2\n"),
+        jobs=1,
+        emit_stubs=True,
     )
 
     assert shortened is True
@@ -928,12 +947,12 @@ def test_run_build_hardlink_fallback_accepts_positive_short_writes(
     )
 
 
-def test_run_build_hardlink_fallback_restores_managed_stub_after_copy_failure(
+async def test_run_build_hardlink_fallback_restores_managed_stub_after_copy_failure(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
     from jaunt import builder as builder_module
 
-    project, stub_path, stale_bytes = _project_with_stale_managed_stub(tmp_path)
+    project, stub_path, stale_bytes = await _project_with_stale_managed_stub(tmp_path)
     src, _spec_path, specs, spec_graph, module_specs, module_dag = project
     real_link = builder_module.os.link
     real_open = builder_module.os.open
@@ -965,19 +984,17 @@ def test_run_build_hardlink_fallback_restores_managed_stub_after_copy_failure(
     monkeypatch.setattr(builder_module.os, "open", track_public_open)
     monkeypatch.setattr(builder_module.os, "write", fail_first_public_copy)
 
-    report = asyncio.run(
-        run_build(
-            package_dir=src,
-            generated_dir="__generated__",
-            module_specs=module_specs,
-            specs=specs,
-            spec_graph=spec_graph,
-            module_dag=module_dag,
-            stale_modules=set(),
-            backend=SourceBackend("unused"),
-            jobs=1,
-            emit_stubs=True,
-        )
+    report = await run_build(
+        package_dir=src,
+        generated_dir="__generated__",
+        module_specs=module_specs,
+        specs=specs,
+        spec_graph=spec_graph,
+        module_dag=module_dag,
+        stale_modules=set(),
+        backend=SourceBackend("unused"),
+        jobs=1,
+        emit_stubs=True,
     )
 
     assert failed_once is True
@@ -988,7 +1005,7 @@ def test_run_build_hardlink_fallback_restores_managed_stub_after_copy_failure(
     assert list(stub_path.parent.glob(".jaunt-stub-candidate-*")) == []
 
 
-def test_run_build_hardlink_fallback_quarantines_concurrent_replacement(
+async def test_run_build_hardlink_fallback_quarantines_concurrent_replacement(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
     from jaunt import builder as builder_module
@@ -1043,19 +1060,17 @@ def test_run_build_hardlink_fallback_quarantines_concurrent_replacement(
     monkeypatch.setattr(builder_module.os, "write", fail_public_write)
     monkeypatch.setattr(builder_module.os, "replace", replace_before_quarantine)
 
-    report = asyncio.run(
-        run_build(
-            package_dir=src,
-            generated_dir="__generated__",
-            module_specs=module_specs,
-            specs=specs,
-            spec_graph=spec_graph,
-            module_dag=module_dag,
-            stale_modules={"pkg.specs"},
-            backend=SourceBackend("def Play(x: int) -> int:\n    return x * 2\n"),
-            jobs=1,
-            emit_stubs=True,
-        )
+    report = await run_build(
+        package_dir=src,
+        generated_dir="__generated__",
+        module_specs=module_specs,
+        specs=specs,
+        spec_graph=spec_graph,
+        module_dag=module_dag,
+        stale_modules={"pkg.specs"},
+        backend=SourceBackend("def Play(x: int) -> int:\n    return x * 2\n"),
+        jobs=1,
+        emit_stubs=True,
     )
 
     quarantines = list(stub_path.parent.glob(".jaunt-stub-quarantine-*"))
@@ -1069,26 +1084,24 @@ def test_run_build_hardlink_fallback_quarantines_concurrent_replacement(
     assert list(stub_path.parent.glob(".jaunt-stub-candidate-*")) == []
 
 
-def test_run_build_recovers_hand_authored_write_at_managed_publish_boundary(
+async def test_run_build_recovers_hand_authored_write_at_managed_publish_boundary(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
     from jaunt import builder as builder_module
 
     src, spec_path, specs, spec_graph, module_specs, module_dag = _single_spec_project(tmp_path)
     stub_path = spec_path.with_suffix(".pyi")
-    first = asyncio.run(
-        run_build(
-            package_dir=src,
-            generated_dir="__generated__",
-            module_specs=module_specs,
-            specs=specs,
-            spec_graph=spec_graph,
-            module_dag=module_dag,
-            stale_modules={"pkg.specs"},
-            backend=SourceBackend("def Play(x: int) -> int:\n    return x * 2\n"),
-            jobs=1,
-            emit_stubs=True,
-        )
+    first = await run_build(
+        package_dir=src,
+        generated_dir="__generated__",
+        module_specs=module_specs,
+        specs=specs,
+        spec_graph=spec_graph,
+        module_dag=module_dag,
+        stale_modules={"pkg.specs"},
+        backend=SourceBackend("def Play(x: int) -> int:\n    return x * 2\n"),
+        jobs=1,
+        emit_stubs=True,
     )
     assert first.failed == {}
     stub_path.write_bytes(stub_path.read_bytes() + b"\n")
@@ -1110,19 +1123,17 @@ def test_run_build_recovers_hand_authored_write_at_managed_publish_boundary(
 
     monkeypatch.setattr(builder_module.os, "replace", replace_after_external_write)
 
-    report = asyncio.run(
-        run_build(
-            package_dir=src,
-            generated_dir="__generated__",
-            module_specs=module_specs,
-            specs=specs,
-            spec_graph=spec_graph,
-            module_dag=module_dag,
-            stale_modules=set(),
-            backend=SourceBackend("unused"),
-            jobs=1,
-            emit_stubs=True,
-        )
+    report = await run_build(
+        package_dir=src,
+        generated_dir="__generated__",
+        module_specs=module_specs,
+        specs=specs,
+        spec_graph=spec_graph,
+        module_dag=module_dag,
+        stale_modules=set(),
+        backend=SourceBackend("unused"),
+        jobs=1,
+        emit_stubs=True,
     )
 
     assert replaced_stub is True
@@ -1137,13 +1148,13 @@ def test_run_build_recovers_hand_authored_write_at_managed_publish_boundary(
 
 
 @pytest.mark.parametrize("link_errno", [errno.EOPNOTSUPP, errno.ENOSYS, errno.EACCES])
-def test_run_build_publishes_managed_stub_when_hardlinks_are_unavailable(
+async def test_run_build_publishes_managed_stub_when_hardlinks_are_unavailable(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch, link_errno: int
 ) -> None:
     from jaunt import builder as builder_module
     from jaunt.stub_emitter import stub_staleness
 
-    project, stub_path, stale_bytes = _project_with_stale_managed_stub(tmp_path)
+    project, stub_path, stale_bytes = await _project_with_stale_managed_stub(tmp_path)
     src, spec_path, specs, spec_graph, module_specs, module_dag = project
     real_link = builder_module.os.link
 
@@ -1154,19 +1165,17 @@ def test_run_build_publishes_managed_stub_when_hardlinks_are_unavailable(
 
     monkeypatch.setattr(builder_module.os, "link", fail_stub_links)
 
-    report = asyncio.run(
-        run_build(
-            package_dir=src,
-            generated_dir="__generated__",
-            module_specs=module_specs,
-            specs=specs,
-            spec_graph=spec_graph,
-            module_dag=module_dag,
-            stale_modules=set(),
-            backend=SourceBackend("unused"),
-            jobs=1,
-            emit_stubs=True,
-        )
+    report = await run_build(
+        package_dir=src,
+        generated_dir="__generated__",
+        module_specs=module_specs,
+        specs=specs,
+        spec_graph=spec_graph,
+        module_dag=module_dag,
+        stale_modules=set(),
+        backend=SourceBackend("unused"),
+        jobs=1,
+        emit_stubs=True,
     )
 
     assert report.generated == set()
@@ -1186,12 +1195,12 @@ def test_run_build_publishes_managed_stub_when_hardlinks_are_unavailable(
     assert list(stub_path.parent.glob(".jaunt-stub-candidate-*")) == []
 
 
-def test_run_build_retains_recovery_when_hardlink_and_copy_restore_fail(
+async def test_run_build_retains_recovery_when_hardlink_and_copy_restore_fail(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
     from jaunt import builder as builder_module
 
-    project, stub_path, stale_bytes = _project_with_stale_managed_stub(tmp_path)
+    project, stub_path, stale_bytes = await _project_with_stale_managed_stub(tmp_path)
     src, _spec_path, specs, spec_graph, module_specs, module_dag = project
     real_link = builder_module.os.link
     real_open = builder_module.os.open
@@ -1209,19 +1218,17 @@ def test_run_build_retains_recovery_when_hardlink_and_copy_restore_fail(
     monkeypatch.setattr(builder_module.os, "link", fail_stub_links)
     monkeypatch.setattr(builder_module.os, "open", fail_exclusive_restore)
 
-    report = asyncio.run(
-        run_build(
-            package_dir=src,
-            generated_dir="__generated__",
-            module_specs=module_specs,
-            specs=specs,
-            spec_graph=spec_graph,
-            module_dag=module_dag,
-            stale_modules=set(),
-            backend=SourceBackend("unused"),
-            jobs=1,
-            emit_stubs=True,
-        )
+    report = await run_build(
+        package_dir=src,
+        generated_dir="__generated__",
+        module_specs=module_specs,
+        specs=specs,
+        spec_graph=spec_graph,
+        module_dag=module_dag,
+        stale_modules=set(),
+        backend=SourceBackend("unused"),
+        jobs=1,
+        emit_stubs=True,
     )
 
     recoveries = list(stub_path.parent.glob(".jaunt-stub-recovery-*"))
@@ -1233,12 +1240,12 @@ def test_run_build_retains_recovery_when_hardlink_and_copy_restore_fail(
     assert list(stub_path.parent.glob(".jaunt-stub-candidate-*")) == []
 
 
-def test_run_build_preserves_hand_authored_race_after_managed_stub_displacement(
+async def test_run_build_preserves_hand_authored_race_after_managed_stub_displacement(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
     from jaunt import builder as builder_module
 
-    project, stub_path, stale_bytes = _project_with_stale_managed_stub(tmp_path)
+    project, stub_path, stale_bytes = await _project_with_stale_managed_stub(tmp_path)
     src, _spec_path, specs, spec_graph, module_specs, module_dag = project
     hand_authored = b"# arrived after displacement\ndef Play(x: int) -> int: ...\n"
     real_link = builder_module.os.link
@@ -1258,19 +1265,17 @@ def test_run_build_preserves_hand_authored_race_after_managed_stub_displacement(
 
     monkeypatch.setattr(builder_module.os, "link", fail_candidate_after_user_write)
 
-    report = asyncio.run(
-        run_build(
-            package_dir=src,
-            generated_dir="__generated__",
-            module_specs=module_specs,
-            specs=specs,
-            spec_graph=spec_graph,
-            module_dag=module_dag,
-            stale_modules=set(),
-            backend=SourceBackend("unused"),
-            jobs=1,
-            emit_stubs=True,
-        )
+    report = await run_build(
+        package_dir=src,
+        generated_dir="__generated__",
+        module_specs=module_specs,
+        specs=specs,
+        spec_graph=spec_graph,
+        module_dag=module_dag,
+        stale_modules=set(),
+        backend=SourceBackend("unused"),
+        jobs=1,
+        emit_stubs=True,
     )
 
     recoveries = list(stub_path.parent.glob(".jaunt-stub-recovery-*"))
@@ -1284,7 +1289,7 @@ def test_run_build_preserves_hand_authored_race_after_managed_stub_displacement(
     assert list(stub_path.parent.glob(".jaunt-stub-candidate-*")) == []
 
 
-def test_run_build_reemits_stub_deleted_after_freshness_check(
+async def test_run_build_reemits_stub_deleted_after_freshness_check(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
     from jaunt import stub_emitter
@@ -1304,19 +1309,17 @@ def test_run_build_reemits_stub_deleted_after_freshness_check(
 
     monkeypatch.setattr(stub_emitter, "stub_staleness", delete_after_freshness_check)
 
-    report = asyncio.run(
-        run_build(
-            package_dir=src,
-            generated_dir="__generated__",
-            module_specs=module_specs,
-            specs=specs,
-            spec_graph=spec_graph,
-            module_dag=module_dag,
-            stale_modules={"pkg.specs"},
-            backend=SourceBackend("def Play(x: int) -> int:\n    return x * 2\n"),
-            jobs=1,
-            emit_stubs=True,
-        )
+    report = await run_build(
+        package_dir=src,
+        generated_dir="__generated__",
+        module_specs=module_specs,
+        specs=specs,
+        spec_graph=spec_graph,
+        module_dag=module_dag,
+        stale_modules={"pkg.specs"},
+        backend=SourceBackend("def Play(x: int) -> int:\n    return x * 2\n"),
+        jobs=1,
+        emit_stubs=True,
     )
 
     assert deleted_stub is True
@@ -1335,42 +1338,38 @@ def test_run_build_reemits_stub_deleted_after_freshness_check(
     )
 
 
-def test_run_build_no_stub_when_emit_stubs_disabled(tmp_path: Path) -> None:
+async def test_run_build_no_stub_when_emit_stubs_disabled(tmp_path: Path) -> None:
     src, spec_path, specs, spec_graph, module_specs, module_dag = _single_spec_project(tmp_path)
-    asyncio.run(
-        run_build(
-            package_dir=src,
-            generated_dir="__generated__",
-            module_specs=module_specs,
-            specs=specs,
-            spec_graph=spec_graph,
-            module_dag=module_dag,
-            stale_modules={"pkg.specs"},
-            backend=SourceBackend("def Play(x: int) -> int:\n    return x\n"),
-            jobs=1,
-        )
+    await run_build(
+        package_dir=src,
+        generated_dir="__generated__",
+        module_specs=module_specs,
+        specs=specs,
+        spec_graph=spec_graph,
+        module_dag=module_dag,
+        stale_modules={"pkg.specs"},
+        backend=SourceBackend("def Play(x: int) -> int:\n    return x\n"),
+        jobs=1,
     )
     assert not spec_path.with_suffix(".pyi").exists()
 
 
-def test_run_build_never_overwrites_hand_authored_stub(tmp_path: Path) -> None:
+async def test_run_build_never_overwrites_hand_authored_stub(tmp_path: Path) -> None:
     src, spec_path, specs, spec_graph, module_specs, module_dag = _single_spec_project(tmp_path)
     stub_path = spec_path.with_suffix(".pyi")
     stub_path.write_text("# hand written\ndef Play(x: int) -> int: ...\n", encoding="utf-8")
 
-    report = asyncio.run(
-        run_build(
-            package_dir=src,
-            generated_dir="__generated__",
-            module_specs=module_specs,
-            specs=specs,
-            spec_graph=spec_graph,
-            module_dag=module_dag,
-            stale_modules={"pkg.specs"},
-            backend=SourceBackend("def Play(x: int) -> int:\n    return x\n"),
-            jobs=1,
-            emit_stubs=True,
-        )
+    report = await run_build(
+        package_dir=src,
+        generated_dir="__generated__",
+        module_specs=module_specs,
+        specs=specs,
+        spec_graph=spec_graph,
+        module_dag=module_dag,
+        stale_modules={"pkg.specs"},
+        backend=SourceBackend("def Play(x: int) -> int:\n    return x\n"),
+        jobs=1,
+        emit_stubs=True,
     )
     # The hand-authored stub is preserved verbatim.
     assert stub_path.read_text(encoding="utf-8") == "# hand written\ndef Play(x: int) -> int: ...\n"
@@ -1378,7 +1377,7 @@ def test_run_build_never_overwrites_hand_authored_stub(tmp_path: Path) -> None:
     assert any("pkg.specs" in w for w in report.stub_warnings)
 
 
-def test_run_build_revalidates_fresh_generated_import_policy(tmp_path: Path) -> None:
+async def test_run_build_revalidates_fresh_generated_import_policy(tmp_path: Path) -> None:
     src = tmp_path / "src"
     spec_path = tmp_path / "specs.py"
     _write(spec_path, "def Play():\n    return 1\n")
@@ -1391,37 +1390,33 @@ def test_run_build_revalidates_fresh_generated_import_policy(tmp_path: Path) ->
     first_backend = SourceBackend(
         "import hallucinated_pkg\n\ndef Play():\n    return hallucinated_pkg.VALUE\n"
     )
-    first = asyncio.run(
-        run_build(
-            package_dir=src,
-            generated_dir="__generated__",
-            module_specs=module_specs,
-            specs=specs,
-            spec_graph=spec_graph,
-            module_dag=module_dag,
-            stale_modules={"pkg.specs"},
-            backend=first_backend,
-            check_generated_imports=False,
-            jobs=1,
-        )
+    first = await run_build(
+        package_dir=src,
+        generated_dir="__generated__",
+        module_specs=module_specs,
+        specs=specs,
+        spec_graph=spec_graph,
+        module_dag=module_dag,
+        stale_modules={"pkg.specs"},
+        backend=first_backend,
+        check_generated_imports=False,
+        jobs=1,
     )
     assert first.failed == {}
     assert first.generated == {"pkg.specs"}
 
     second_backend = SourceBackend("def Play():\n    return 2\n")
-    second = asyncio.run(
-        run_build(
-            package_dir=src,
-            generated_dir="__generated__",
-            module_specs=module_specs,
-            specs=specs,
-            spec_graph=spec_graph,
-            module_dag=module_dag,
-            stale_modules=set(),
-            backend=second_backend,
-            check_generated_imports=True,
-            jobs=1,
-        )
+    second = await run_build(
+        package_dir=src,
+        generated_dir="__generated__",
+        module_specs=module_specs,
+        specs=specs,
+        spec_graph=spec_graph,
+        module_dag=module_dag,
+        stale_modules=set(),
+        backend=second_backend,
+        check_generated_imports=True,
+        jobs=1,
     )
 
     assert second.generated == set()
@@ -1431,7 +1426,7 @@ def test_run_build_revalidates_fresh_generated_import_policy(tmp_path: Path) ->
     assert "hallucinated_pkg" in "\n".join(second.failed["pkg.specs"])
 
 
-def test_run_build_targeted_skips_out_of_scope_import_validation(tmp_path: Path) -> None:
+async def test_run_build_targeted_skips_out_of_scope_import_validation(tmp_path: Path) -> None:
     src = tmp_path / "src"
     bad_path = tmp_path / "bad.py"
     target_path = tmp_path / "target.py"
@@ -1441,38 +1436,34 @@ def test_run_build_targeted_skips_out_of_scope_import_validation(tmp_path: Path)
     target = _entry(module="pkg.target", qualname="Target", source_file=str(target_path))
 
     # First, generate pkg.bad with an undeclared import (gate off) so the file lands on disk.
-    asyncio.run(
-        run_build(
-            package_dir=src,
-            generated_dir="__generated__",
-            module_specs={"pkg.bad": [bad]},
-            specs={bad.spec_ref: bad},
-            spec_graph=build_spec_graph({bad.spec_ref: bad}, infer_default=False),
-            module_dag={"pkg.bad": set()},
-            stale_modules={"pkg.bad"},
-            backend=SourceBackend("import hallucinated_pkg\n\ndef Bad():\n    return 1\n"),
-            check_generated_imports=False,
-            jobs=1,
-        )
+    await run_build(
+        package_dir=src,
+        generated_dir="__generated__",
+        module_specs={"pkg.bad": [bad]},
+        specs={bad.spec_ref: bad},
+        spec_graph=build_spec_graph({bad.spec_ref: bad}, infer_default=False),
+        module_dag={"pkg.bad": set()},
+        stale_modules={"pkg.bad"},
+        backend=SourceBackend("import hallucinated_pkg\n\ndef Bad():\n    return 1\n"),
+        check_generated_imports=False,
+        jobs=1,
     )
 
     # Targeted build at pkg.target with the gate ON. pkg.bad is out of the requested
     # closure (skipped, not in allowed_modules) and must NOT be import-validated.
     specs = {bad.spec_ref: bad, target.spec_ref: target}
-    report = asyncio.run(
-        run_build(
-            package_dir=src,
-            generated_dir="__generated__",
-            module_specs={"pkg.bad": [bad], "pkg.target": [target]},
-            specs=specs,
-            spec_graph=build_spec_graph(specs, infer_default=False),
-            module_dag={"pkg.bad": set(), "pkg.target": set()},
-            stale_modules={"pkg.target"},
-            allowed_modules={"pkg.target"},
-            backend=SourceBackend("def Target():\n    return 1\n"),
-            check_generated_imports=True,
-            jobs=1,
-        )
+    report = await run_build(
+        package_dir=src,
+        generated_dir="__generated__",
+        module_specs={"pkg.bad": [bad], "pkg.target": [target]},
+        specs=specs,
+        spec_graph=build_spec_graph(specs, infer_default=False),
+        module_dag={"pkg.bad": set(), "pkg.target": set()},
+        stale_modules={"pkg.target"},
+        allowed_modules={"pkg.target"},
+        backend=SourceBackend("def Target():\n    return 1\n"),
+        check_generated_imports=True,
+        jobs=1,
     )
 
     assert report.failed == {}
@@ -1480,7 +1471,7 @@ def test_run_build_targeted_skips_out_of_scope_import_validation(tmp_path: Path)
     assert "pkg.target" in report.generated
 
 
-def test_non_stale_modules_are_skipped(tmp_path: Path) -> None:
+async def test_non_stale_modules_are_skipped(tmp_path: Path) -> None:
     src = tmp_path / "src"
     a_path = tmp_path / "a.py"
     _write(a_path, "def A():\n    return 1\n")
@@ -1492,18 +1483,16 @@ def test_non_stale_modules_are_skipped(tmp_path: Path) -> None:
     module_dag = {"pkg.a": set()}
 
     backend = FakeBackend()
-    report = asyncio.run(
-        run_build(
-            package_dir=src,
-            generated_dir="__generated__",
-            module_specs=module_specs,
-            specs=specs,
-            spec_graph=spec_graph,
-            module_dag=module_dag,
-            stale_modules=set(),
-            backend=backend,
-            jobs=1,
-        )
+    report = await run_build(
+        package_dir=src,
+        generated_dir="__generated__",
+        module_specs=module_specs,
+        specs=specs,
+        spec_graph=spec_graph,
+        module_dag=module_dag,
+        stale_modules=set(),
+        backend=backend,
+        jobs=1,
     )
     assert report.generated == set()
     assert report.failed == {}
@@ -1511,7 +1500,7 @@ def test_non_stale_modules_are_skipped(tmp_path: Path) -> None:
     assert backend.calls == []
 
 
-def test_dependency_context_passed_to_backend(tmp_path: Path) -> None:
+async def test_dependency_context_passed_to_backend(tmp_path: Path) -> None:
     """When module b depends on module a, the backend should receive a's spec source
     as dependency_apis and a's generated source as dependency_generated_modules."""
     src = tmp_path / "src"
@@ -1531,18 +1520,16 @@ def test_dependency_context_passed_to_backend(tmp_path: Path) -> None:
     module_dag = {"pkg.a": set(), "pkg.b": {"pkg.a"}}
 
     backend = FakeBackend()
-    report = asyncio.run(
-        run_build(
-            package_dir=src,
-            generated_dir="__generated__",
-            module_specs=module_specs,
-            specs=specs,
-            spec_graph=spec_graph,
-            module_dag=module_dag,
-            stale_modules=set(module_specs.keys()),
-            backend=backend,
-            jobs=1,
-        )
+    report = await run_build(
+        package_dir=src,
+        generated_dir="__generated__",
+        module_specs=module_specs,
+        specs=specs,
+        spec_graph=spec_graph,
+        module_dag=module_dag,
+        stale_modules=set(module_specs.keys()),
+        backend=backend,
+        jobs=1,
     )
 
     assert report.failed == {}
@@ -1560,7 +1547,7 @@ def test_dependency_context_passed_to_backend(tmp_path: Path) -> None:
     assert "def A():" in b_ctx.dependency_generated_modules["pkg.a"]
 
 
-def test_scheduler_cycle_raises(tmp_path: Path) -> None:
+async def test_scheduler_cycle_raises(tmp_path: Path) -> None:
     src = tmp_path / "src"
 
     a_path = tmp_path / "a.py"
@@ -1578,22 +1565,20 @@ def test_scheduler_cycle_raises(tmp_path: Path) -> None:
 
     backend = FakeBackend()
     with pytest.raises(JauntDependencyCycleError):
-        asyncio.run(
-            run_build(
-                package_dir=src,
-                generated_dir="__generated__",
-                module_specs=module_specs,
-                specs=specs,
-                spec_graph=spec_graph,
-                module_dag=module_dag,
-                stale_modules=set(module_specs.keys()),
-                backend=backend,
-                jobs=1,
-            )
+        await run_build(
+            package_dir=src,
+            generated_dir="__generated__",
+            module_specs=module_specs,
+            specs=specs,
+            spec_graph=spec_graph,
+            module_dag=module_dag,
+            stale_modules=set(module_specs.keys()),
+            backend=backend,
+            jobs=1,
         )
 
 
-def test_scheduler_splits_disconnected_specs_within_module(tmp_path: Path) -> None:
+async def test_scheduler_splits_disconnected_specs_within_module(tmp_path: Path) -> None:
     spec_path = tmp_path / "mod.py"
     _write(
         spec_path,
@@ -1609,24 +1594,22 @@ def test_scheduler_splits_disconnected_specs_within_module(tmp_path: Path) -> No
 
     backend = FakeBackend()
     progress_output = io.StringIO()
-    report = asyncio.run(
-        run_build(
-            package_dir=tmp_path,
-            generated_dir="__generated__",
-            module_specs=module_specs,
-            specs=specs,
-            spec_graph=spec_graph,
-            module_dag=module_dag,
-            stale_modules={"pkg.mod"},
-            backend=backend,
-            jobs=2,
-            progress=ProgressBar(
-                label="build",
-                total=1,
-                mode="plain",
-                stream=progress_output,
-            ),
-        )
+    report = await run_build(
+        package_dir=tmp_path,
+        generated_dir="__generated__",
+        module_specs=module_specs,
+        specs=specs,
+        spec_graph=spec_graph,
+        module_dag=module_dag,
+        stale_modules={"pkg.mod"},
+        backend=backend,
+        jobs=2,
+        progress=ProgressBar(
+            label="build",
+            total=1,
+            mode="plain",
+            stream=progress_output,
+        ),
     )
 
     assert report.failed == {}
@@ -1663,7 +1646,7 @@ def test_scheduler_splits_disconnected_specs_within_module(tmp_path: Path) -> No
     assert "def B():" in generated
 
 
-def test_scheduler_attributes_retries_and_cost_to_one_module(tmp_path: Path) -> None:
+async def test_scheduler_attributes_retries_and_cost_to_one_module(tmp_path: Path) -> None:
     class RetryBackend(GeneratorBackend):
         def __init__(self) -> None:
             self.calls = 0
@@ -1698,25 +1681,23 @@ def test_scheduler_attributes_retries_and_cost_to_one_module(tmp_path: Path) ->
     tracker = CostTracker()
     progress_output = io.StringIO()
 
-    report = asyncio.run(
-        run_build(
-            package_dir=tmp_path,
-            generated_dir="__generated__",
-            module_specs={"pkg.mod": [entry]},
-            specs=specs,
-            spec_graph=build_spec_graph(specs, infer_default=False),
-            module_dag={"pkg.mod": set()},
-            stale_modules={"pkg.mod"},
-            backend=backend,
-            jobs=1,
-            cost_tracker=tracker,
-            progress=ProgressBar(
-                label="build",
-                total=1,
-                mode="plain",
-                stream=progress_output,
-            ),
-        )
+    report = await run_build(
+        package_dir=tmp_path,
+        generated_dir="__generated__",
+        module_specs={"pkg.mod": [entry]},
+        specs=specs,
+        spec_graph=build_spec_graph(specs, infer_default=False),
+        module_dag={"pkg.mod": set()},
+        stale_modules={"pkg.mod"},
+        backend=backend,
+        jobs=1,
+        cost_tracker=tracker,
+        progress=ProgressBar(
+            label="build",
+            total=1,
+            mode="plain",
+            stream=progress_output,
+        ),
     )
 
     assert report.failed == {}
@@ -1792,28 +1773,26 @@ def test_attached_test_context_is_neutral_to_equivalent_path_move(tmp_path: Path
     )
 
 
-def test_run_build_normalizes_generated_python_with_ruff(tmp_path: Path) -> None:
+async def test_run_build_normalizes_generated_python_with_ruff(tmp_path: Path) -> None:
     spec_path = tmp_path / "mod.py"
     _write(spec_path, "def A():\n    return None\n")
     entry = _entry(module="pkg.mod", qualname="A", source_file=str(spec_path))
     specs = {entry.spec_ref: entry}
-    report = asyncio.run(
-        run_build(
-            package_dir=tmp_path,
-            generated_dir="__generated__",
-            module_specs={"pkg.mod": [entry]},
-            specs=specs,
-            spec_graph=build_spec_graph(specs, infer_default=False),
-            module_dag={"pkg.mod": set()},
-            stale_modules={"pkg.mod"},
-            backend=SourceBackend(
-                "from typing import Any\n"
-                "from typing import Any, Optional\n\n"
-                "def A( value: Optional[Any]=None )->Optional[Any]:\n"
-                " return value\n"
-            ),
-            jobs=1,
-        )
+    report = await run_build(
+        package_dir=tmp_path,
+        generated_dir="__generated__",
+        module_specs={"pkg.mod": [entry]},
+        specs=specs,
+        spec_graph=build_spec_graph(specs, infer_default=False),
+        module_dag={"pkg.mod": set()},
+        stale_modules={"pkg.mod"},
+        backend=SourceBackend(
+            "from typing import Any\n"
+            "from typing import Any, Optional\n\n"
+            "def A( value: Optional[Any]=None )->Optional[Any]:\n"
+            " return value\n"
+        ),
+        jobs=1,
     )
 
     assert report.failed == {}
@@ -1844,7 +1823,7 @@ def test_run_build_normalizes_generated_python_with_ruff(tmp_path: Path) -> None
     )
 
 
-def test_scheduler_keeps_connected_specs_in_same_module_together(tmp_path: Path) -> None:
+async def test_scheduler_keeps_connected_specs_in_same_module_together(tmp_path: Path) -> None:
     spec_path = tmp_path / "mod.py"
     _write(
         spec_path,
@@ -1859,18 +1838,16 @@ def test_scheduler_keeps_connected_specs_in_same_module_together(tmp_path: Path)
     module_dag = {"pkg.mod": set()}
 
     backend = FakeBackend()
-    report = asyncio.run(
-        run_build(
-            package_dir=tmp_path,
-            generated_dir="__generated__",
-            module_specs=module_specs,
-            specs=specs,
-            spec_graph=spec_graph,
-            module_dag=module_dag,
-            stale_modules={"pkg.mod"},
-            backend=backend,
-            jobs=2,
-        )
+    report = await run_build(
+        package_dir=tmp_path,
+        generated_dir="__generated__",
+        module_specs=module_specs,
+        specs=specs,
+        spec_graph=spec_graph,
+        module_dag=module_dag,
+        stale_modules={"pkg.mod"},
+        backend=backend,
+        jobs=2,
     )
 
     assert report.failed == {}
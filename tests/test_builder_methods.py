@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-import asyncio
+from collections.abc import Generator
 from pathlib import Path
 
-from jaunt.builder import run_build
+import pytest
+
+from jaunt.builder import BuildReport, run_build
 from jaunt.deps import build_spec_graph
 from jaunt.generate.base import GeneratorBackend, ModuleSpecContext
 from jaunt.registry import SpecEntry
@@ -59,8 +61,50 @@ class _CapturingBackend(GeneratorBackend):
                 lines.append(f"    return {name!r}")
         return "\n".join(lines) + "\n", None
 
+    def reset(self) -> None:
+        self.contexts.clear()
+
+
+# run_build only reads these, so every test can share them.
+_MODULE_DAG: dict[str, set[str]] = {"pkg.mod": set()}
+_STALE_MODULES = {"pkg.mod"}
+
+
+@pytest.fixture(scope="module")
+def _shared_backend() -> _CapturingBackend:
+    return _CapturingBackend()
+
+
+@pytest.fixture
+def backend(_shared_backend: _CapturingBackend) -> Generator[_CapturingBackend, None, None]:
+    yield _shared_backend
+    _shared_backend.reset()
+
 
-def test_method_specs_grouped_by_class_in_expected_names(tmp_path: Path) -> None:
+async def _build_module(
+    tmp_path: Path,
+    backend: _CapturingBackend,
+    entries: list[SpecEntry],
+) -> BuildReport:
+    """Build the single module ``pkg.mod`` from ``entries`` with a capturing backend."""
+    specs = {e.spec_ref: e for e in entries}
+    return await run_build(
+        package_dir=tmp_path,
+        generated_dir="__generated__",
+        module_specs={"pkg.mod": entries},
+        specs=specs,
+        spec_graph=build_spec_graph(specs, infer_default=False),
+        module_dag=_MODULE_DAG,
+        stale_modules=_STALE_MODULES,
+        backend=backend,
+        jobs=1,
+    )
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_method_specs_grouped_by_class_in_expected_names(
+    tmp_path: Path, backend: _CapturingBackend
+) -> None:
     """Method specs from the same class should produce a class-level expected_name."""
     spec_path = tmp_path / "mod.py"
     _write(
@@ -85,25 +129,7 @@ def test_method_specs_grouped_by_class_in_expected_names(tmp_path: Path) -> None
         source_file=str(spec_path),
         class_name="MyService",
     )
-    specs = {e1.spec_ref: e1, e2.spec_ref: e2}
-    spec_graph = build_spec_graph(specs, infer_default=False)
-    module_specs = {"pkg.mod": [e1, e2]}
-    module_dag: dict[str, set[str]] = {"pkg.mod": set()}
-
-    backend = _CapturingBackend()
-    report = asyncio.run(
-        run_build(
-            package_dir=tmp_path,
-            generated_dir="__generated__",
-            module_specs=module_specs,
-            specs=specs,
-            spec_graph=spec_graph,
-            module_dag=module_dag,
-            stale_modules={"pkg.mod"},
-            backend=backend,
-            jobs=1,
-        )
-    )
+    report = await _build_module(tmp_path, backend, [e1, e2])
     assert not report.failed, report.failed
     assert len(backend.contexts) == 1
     ctx = backend.contexts[0]
@@ -113,7 +139,10 @@ def test_method_specs_grouped_by_class_in_expected_names(tmp_path: Path) -> None
     assert "MyService.delete_user" not in ctx.expected_names
 
 
-def test_mixed_functions_and_methods_in_same_module(tmp_path: Path) -> None:
+@pytest.mark.asyncio(loop_scope="module")
+async def test_mixed_functions_and_methods_in_same_module(
+    tmp_path: Path, backend: _CapturingBackend
+) -> None:
     """A module with both top-level functions and method specs should work."""
     spec_path = tmp_path / "mod.py"
     _write(
@@ -133,25 +162,7 @@ def test_mixed_functions_and_methods_in_same_module(tmp_path: Path) -> None:
         source_file=str(spec_path),
         class_name="MyService",
     )
-    specs = {e_fn.spec_ref: e_fn, e_method.spec_ref: e_method}
-    spec_graph = build_spec_graph(specs, infer_default=False)
-    module_specs = {"pkg.mod": [e_fn, e_method]}
-    module_dag: dict[str, set[str]] = {"pkg.mod": set()}
-
-    backend = _CapturingBackend()
-    report = asyncio.run(
-        run_build(
-            package_dir=tmp_path,
-            generated_dir="__generated__",
-            module_specs=module_specs,
-            specs=specs,
-            spec_graph=spec_graph,
-            module_dag=module_dag,
-            stale_modules={"pkg.mod"},
-            backend=backend,
-            jobs=1,
-        )
-    )
+    report = await _build_module(tmp_path, backend, [e_fn, e_method])
     assert not report.failed, report.failed
     ctx = backend.contexts[0]
     assert "helper" in ctx.expected_names
@@ -159,7 +170,10 @@ def test_mixed_functions_and_methods_in_same_module(tmp_path: Path) -> None:
     assert len(ctx.expected_names) == 2
 
 
-def test_multiple_classes_with_methods_in_one_module(tmp_path: Path) -> None:
+@pytest.mark.asyncio(loop_scope="module")
+async def test_multiple_classes_with_methods_in_one_module(
+    tmp_path: Path, backend: _CapturingBackend
+) -> None:
     """Two classes with method specs in the same module should produce both class names."""
     spec_path = tmp_path / "mod.py"
     _write(
@@ -185,32 +199,17 @@ def test_multiple_classes_with_methods_in_one_module(tmp_path: Path) -> None:
         source_file=str(spec_path),
         class_name="ServiceB",
     )
-    specs = {e1.spec_ref: e1, e2.spec_ref: e2}
-    spec_graph = build_spec_graph(specs, infer_default=False)
-    module_specs = {"pkg.mod": [e1, e2]}
-    module_dag: dict[str, set[str]] = {"pkg.mod": set()}
-
-    backend = _CapturingBackend()
-    report = asyncio.run(
-        run_build(
-            package_dir=tmp_path,
-            generated_dir="__generated__",
-            module_specs=module_specs,
-            specs=specs,
-            spec_graph=spec_graph,
-            module_dag=module_dag,
-            stale_modules={"pkg.mod"},
-            backend=backend,
-            jobs=1,
-        )
-    )
+    report = await _build_module(tmp_path, backend, [e1, e2])
     assert not report.failed, report.failed
     ctx = backend.contexts[0]
     assert "ServiceA" in ctx.expected_names
     assert "ServiceB" in ctx.expected_names
 
 
-def test_class_source_included_in_spec_sources(tmp_path: Path) -> None:
+@pytest.mark.asyncio(loop_scope="module")
+async def test_class_source_included_in_spec_sources(
+    tmp_path: Path, backend: _CapturingBackend
+) -> None:
     """spec_sources for method entries should include the full class source."""
     spec_path = tmp_path / "mod.py"
     _write(
@@ -231,25 +230,7 @@ def test_class_source_included_in_spec_sources(tmp_path: Path) -> None:
         source_file=str(spec_path),
         class_name="MyService",
     )
-    specs = {e.spec_ref: e}
-    spec_graph = build_spec_graph(specs, infer_default=False)
-    module_specs = {"pkg.mod": [e]}
-    module_dag: dict[str, set[str]] = {"pkg.mod": set()}
-
-    backend = _CapturingBackend()
-    report = asyncio.run(
-        run_build(
-            package_dir=tmp_path,
-            generated_dir="__generated__",
-            module_specs=module_specs,
-            specs=specs,
-            spec_graph=spec_graph,
-            module_dag=module_dag,
-            stale_modules={"pkg.mod"},
-            backend=backend,
-            jobs=1,
-        )
-    )
+    report = await _build_module(tmp_path, backend, [e])
     assert not report.failed, report.failed
     ctx = backend.contexts[0]
     sources = list(ctx.spec_sources.values())
@@ -257,7 +238,10 @@ def test_class_source_included_in_spec_sources(tmp_path: Path) -> None:
     assert any("def helper" in s for s in sources)
 
 
-def test_rejects_class_and_method_magic_on_same_class(tmp_path: Path) -> None:
+@pytest.mark.asyncio(loop_scope="module")
+async def test_rejects_class_and_method_magic_on_same_class(
+    tmp_path: Path, backend: _CapturingBackend
+) -> None:
     """Cannot combine whole-class @magic with individual method @magic."""
     spec_path = tmp_path / "mod.py"
     _write(
@@ -279,25 +263,7 @@ def test_rejects_class_and_method_magic_on_same_class(tmp_path: Path) -> None:
         source_file=str(spec_path),
         class_name="MyService",
     )
-    specs = {e_class.spec_ref: e_class, e_method.spec_ref: e_method}
-    spec_graph = build_spec_graph(specs, infer_default=False)
-    module_specs = {"pkg.mod": [e_class, e_method]}
-    module_dag: dict[str, set[str]] = {"pkg.mod": set()}
-
-    backend = _CapturingBackend()
-    report = asyncio.run(
-        run_build(
-            package_dir=tmp_path,
-            generated_dir="__generated__",
-            module_specs=module_specs,
-            specs=specs,
-            spec_graph=spec_graph,
-            module_dag=module_dag,
-            stale_modules={"pkg.mod"},
-            backend=backend,
-            jobs=1,
-        )
-    )
+    report = await _build_module(tmp_path, backend, [e_class, e_method])
     # Should fail with an error about conflicting class/method magic
     assert "pkg.mod" in report.failed
     errs = report.failed["pkg.mod"]
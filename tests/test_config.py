@@ -4,52 +4,28 @@ from pathlib import Path
 
 import pytest
 
-from jaunt.config import CodexConfig, find_project_root, load_config
+from jaunt.config import CodexConfig, JauntConfig, find_project_root, load_config
 from jaunt.errors import JauntConfigError
 
 
-def test_load_minimal_config_defaults_apply(tmp_path: Path) -> None:
-    (tmp_path / "jaunt.toml").write_text("version = 1\n", encoding="utf-8")
-    cfg = load_config(root=tmp_path)
-
-    assert cfg.version == 1
-    assert cfg.paths.source_roots == ["src", "."]
-    assert cfg.paths.test_roots == ["tests"]
-    assert cfg.paths.generated_dir == "__generated__"
-
-    assert cfg.llm.provider == "openai"
-    assert cfg.llm.model == "gpt-5.2"
-    assert cfg.llm.api_key_env == "OPENAI_API_KEY"
-    assert cfg.llm.reasoning_effort is None
-    assert cfg.llm.anthropic_thinking_budget_tokens is None
-
-    assert cfg.build.jobs == 8
-    assert cfg.build.infer_deps is True
-    assert cfg.build.ty_retry_attempts == 1
-    assert cfg.build.async_runner == "asyncio"
-    assert cfg.build.include_target_tests is False
-    assert cfg.build.check_generated_imports is True
-    assert cfg.build.generated_import_allowlist == []
-    assert cfg.build.instructions == []
+@pytest.fixture(scope="module")
+def minimal_root(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A project root whose `jaunt.toml` only sets the version."""
+    root = tmp_path_factory.mktemp("minimal")
+    (root / "jaunt.toml").write_text("version = 1\n", encoding="utf-8")
+    return root
 
-    assert cfg.test.jobs == 4
-    assert cfg.test.infer_deps is True
-    assert cfg.test.pytest_args == ["-q"]
 
-    assert cfg.prompts.build_system == ""
-    assert cfg.prompts.build_module == ""
-    assert cfg.prompts.test_system == ""
-    assert cfg.prompts.test_module == ""
-    assert cfg.agent.engine == "codex"
-    assert cfg.codex.quota_wait_minutes == 0.0
-    assert cfg.codex.fingerprint_cli_version is False
-    assert cfg.daemon.poll_interval == 2.0
-    assert cfg.daemon.max_jobs == 0
-    assert cfg.daemon.notify_command == ""
+@pytest.fixture(scope="module")
+def minimal_config(minimal_root: Path) -> JauntConfig:
+    return load_config(root=minimal_root)
 
 
-def test_load_config_overrides_work(tmp_path: Path) -> None:
-    (tmp_path / "jaunt.toml").write_text(
+@pytest.fixture(scope="module")
+def overrides_project(tmp_path_factory: pytest.TempPathFactory) -> tuple[Path, JauntConfig]:
+    """A project root that overrides most keys, loaded once for the module."""
+    root = tmp_path_factory.mktemp("overrides")
+    (root / "jaunt.toml").write_text(
         "\n".join(
             [
                 "version = 1",
@@ -100,9 +76,51 @@ def test_load_config_overrides_work(tmp_path: Path) -> None:
         + "\n",
         encoding="utf-8",
     )
-    (tmp_path / "src").mkdir()
+    (root / "src").mkdir()
+    return root, load_config(root=root)
 
-    cfg = load_config(root=tmp_path)
+
+def test_load_minimal_config_defaults_apply(minimal_config: JauntConfig) -> None:
+    cfg = minimal_config
+
+    assert cfg.version == 1
+    assert cfg.paths.source_roots == ["src", "."]
+    assert cfg.paths.test_roots == ["tests"]
+    assert cfg.paths.generated_dir == "__generated__"
+
+    assert cfg.llm.provider == "openai"
+    assert cfg.llm.model == "gpt-5.2"
+    assert cfg.llm.api_key_env == "OPENAI_API_KEY"
+    assert cfg.llm.reasoning_effort is None
+    assert cfg.llm.anthropic_thinking_budget_tokens is None
+
+    assert cfg.build.jobs == 8
+    assert cfg.build.infer_deps is True
+    assert cfg.build.ty_retry_attempts == 1
+    assert cfg.build.async_runner == "asyncio"
+    assert cfg.build.include_target_tests is False
+    assert cfg.build.check_generated_imports is True
+    assert cfg.build.generated_import_allowlist == []
+    assert cfg.build.instructions == []
+
+    assert cfg.test.jobs == 4
+    assert cfg.test.infer_deps is True
+    assert cfg.test.pytest_args == ["-q"]
+
+    assert cfg.prompts.build_system == ""
+    assert cfg.prompts.build_module == ""
+    assert cfg.prompts.test_system == ""
+    assert cfg.prompts.test_module == ""
+    assert cfg.agent.engine == "codex"
+    assert cfg.codex.quota_wait_minutes == 0.0
+    assert cfg.codex.fingerprint_cli_version is False
+    assert cfg.daemon.poll_interval == 2.0
+    assert cfg.daemon.max_jobs == 0
+    assert cfg.daemon.notify_command == ""
+
+
+def test_load_config_overrides_work(overrides_project: tuple[Path, JauntConfig]) -> None:
+    root, cfg = overrides_project
     assert cfg.paths.source_roots == ["src"]
     assert cfg.paths.test_roots == ["t"]
     assert cfg.paths.generated_dir == "__gen__"
@@ -125,10 +143,10 @@ def test_load_config_overrides_work(tmp_path: Path) -> None:
     assert cfg.test.infer_deps is False
     assert cfg.test.pytest_args == ["-q", "-x"]
 
-    assert cfg.prompts.build_system == str((tmp_path / "bs").resolve())
-    assert cfg.prompts.build_module == str((tmp_path / "bm").resolve())
-    assert cfg.prompts.test_system == str((tmp_path / "ts").resolve())
-    assert cfg.prompts.test_module == str((tmp_path / "tm").resolve())
+    assert cfg.prompts.build_system == str((root / "bs").resolve())
+    assert cfg.prompts.build_module == str((root / "bm").resolve())
+    assert cfg.prompts.test_system == str((root / "ts").resolve())
+    assert cfg.prompts.test_module == str((root / "tm").resolve())
     assert cfg.agent.engine == "codex"
     assert cfg.codex.model == "gpt-5.2-codex"
     assert cfg.codex.reasoning_effort == "medium"
@@ -378,112 +396,37 @@ def test_find_project_root_failure(tmp_path: Path) -> None:
     assert "jaunt.toml" in str(ei.value)
 
 
-def test_validation_bad_generated_dir_raises(tmp_path: Path) -> None:
-    (tmp_path / "jaunt.toml").write_text(
-        "\n".join(
-            [
-                "version = 1",
-                "",
-                "[paths]",
-                'generated_dir = "not-an-ident!"',
-                "",
-            ]
-        )
-        + "\n",
-        encoding="utf-8",
-    )
-    with pytest.raises(JauntConfigError):
-        load_config(root=tmp_path)
-
-
-def test_validation_jobs_must_be_ge_1(tmp_path: Path) -> None:
-    (tmp_path / "jaunt.toml").write_text(
-        "\n".join(
-            [
-                "version = 1",
-                "",
-                "[build]",
-                "jobs = 0",
-                "",
-            ]
-        )
-        + "\n",
-        encoding="utf-8",
-    )
-    with pytest.raises(JauntConfigError):
-        load_config(root=tmp_path)
-
-
-def test_validation_ty_retry_attempts_must_be_ge_0(tmp_path: Path) -> None:
-    (tmp_path / "jaunt.toml").write_text(
-        "\n".join(
-            [
-                "version = 1",
-                "",
-                "[build]",
-                "ty_retry_attempts = -1",
-                "",
-            ]
-        )
-        + "\n",
-        encoding="utf-8",
-    )
-    with pytest.raises(JauntConfigError):
-        load_config(root=tmp_path)
-
-
-def test_validation_anthropic_thinking_budget_tokens_must_be_int(tmp_path: Path) -> None:
-    (tmp_path / "jaunt.toml").write_text(
-        "\n".join(
-            [
-                "version = 1",
-                "",
-                "[llm]",
-                'anthropic_thinking_budget_tokens = "oops"',
-                "",
-            ]
-        )
-        + "\n",
-        encoding="utf-8",
-    )
-    with pytest.raises(JauntConfigError):
-        load_config(root=tmp_path)
-
-
-def test_validation_anthropic_thinking_budget_tokens_must_be_ge_1(tmp_path: Path) -> None:
-    (tmp_path / "jaunt.toml").write_text(
-        "\n".join(
-            [
-                "version = 1",
-                "",
-                "[llm]",
-                "anthropic_thinking_budget_tokens = 0",
-                "",
-            ]
-        )
-        + "\n",
-        encoding="utf-8",
-    )
-    with pytest.raises(JauntConfigError, match="anthropic_thinking_budget_tokens"):
-        load_config(root=tmp_path)
-
-
-def test_validation_agent_engine_must_be_known(tmp_path: Path) -> None:
+@pytest.mark.parametrize(
+    ("snippet", "match"),
+    [
+        pytest.param(
+            '[paths]\ngenerated_dir = "not-an-ident!"',
+            r"paths\.generated_dir must be a valid Python identifier",
+            id="generated_dir-identifier",
+        ),
+        pytest.param("[build]\njobs = 0", r"jobs must be >= 1", id="jobs-ge-1"),
+        pytest.param(
+            "[build]\nty_retry_attempts = -1",
+            r"build\.ty_retry_attempts must be >= 0",
+            id="ty_retry_attempts-ge-0",
+        ),
+        pytest.param(
+            '[llm]\nanthropic_thinking_budget_tokens = "oops"',
+            r"llm\.anthropic_thinking_budget_tokens to be an integer",
+            id="thinking_budget-int",
+        ),
+        pytest.param(
+            "[llm]\nanthropic_thinking_budget_tokens = 0",
+            r"llm\.anthropic_thinking_budget_tokens must be >= 1",
+            id="thinking_budget-ge-1",
+        ),
+        pytest.param('[agent]\nengine = "unknown"', r"agent\.engine", id="agent-engine-known"),
+    ],
+)
+def test_validation_rejects(tmp_path: Path, snippet: str, match: str) -> None:
     (tmp_path / "src").mkdir()
-    (tmp_path / "jaunt.toml").write_text(
-        "\n".join(
-            [
-                "version = 1",
-                "",
-                "[agent]",
-                'engine = "unknown"',
-                "",
-            ]
-        )
-        + "\n",
-        encoding="utf-8",
-    )
-    with pytest.raises(JauntConfigError, match="agent.engine"):
+    (tmp_path / "jaunt.toml").write_text(f"version = 1\n\n{snippet}\n", encoding="utf-8")
+    with pytest.raises(JauntConfigError, match=match):
         load_config(root=tmp_path)
 
 
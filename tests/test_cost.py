@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import pytest
 
-from jaunt.cost import CostTracker, _estimate_cost
+from jaunt.cost import CostTracker, _estimate_cost, _rates_for
 from jaunt.errors import JauntBudgetExceededError
 from jaunt.generate.base import TokenUsage
 
@@ -104,3 +104,13 @@ def test_longest_prefix_match() -> None:
     cost_base = _estimate_cost("gpt-4.1", 1_000_000, 1_000_000)
     # mini should be cheaper
     assert cost_mini < cost_base
+
+
+def test_estimate_cost_resolves_each_model_once() -> None:
+    _rates_for.cache_clear()
+    first = _estimate_cost("gpt-5-mini", 1000, 1000)
+    second = _estimate_cost("gpt-5-mini", 1000, 1000)
+
+    assert first == second > 0.0
+    info = _rates_for.cache_info()
+    assert (info.misses, info.hits) == (1, 1)
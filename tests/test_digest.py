@@ -3,8 +3,17 @@ from __future__ import annotations
 import re
 from pathlib import Path
 
+import pytest
+
+import jaunt.digest
 from jaunt.deps import build_spec_graph
-from jaunt.digest import extract_source_segment, graph_digest, local_digest, module_digest
+from jaunt.digest import (
+    _top_level_segments,
+    extract_source_segment,
+    graph_digest,
+    local_digest,
+    module_digest,
+)
 from jaunt.registry import SpecEntry
 from jaunt.spec_ref import normalize_spec_ref
 
@@ -33,22 +42,26 @@ def _entry(
     )
 
 
-def test_local_digest_is_deterministic_and_hex(tmp_path: Path) -> None:
-    p = tmp_path / "m.py"
-    _write(
-        p,
-        """
+@pytest.fixture
+def sources(monkeypatch: pytest.MonkeyPatch) -> dict[str, str]:
+    """In-memory spec files, keyed by the ``source_file`` the entries point at."""
+    files: dict[str, str] = {}
+    monkeypatch.setattr(jaunt.digest, "_read_source", files.__getitem__)
+    return files
+
+
+def test_local_digest_is_deterministic_and_hex(sources: dict[str, str]) -> None:
+    sources["m.py"] = """
 def Foo():
     x = 1
     return x
-""".lstrip(),
-    )
+""".lstrip()
     e = _entry(
         kind="magic",
         spec_ref="m:Foo",
         module="m",
         qualname="Foo",
-        source_file=str(p),
+        source_file="m.py",
         decorator_kwargs={"deps": ["m:Bar"], "infer_deps": False},
     )
 
@@ -58,21 +71,17 @@ def Foo():
     assert re.fullmatch(r"[0-9a-f]{64}", d1) is not None
 
 
-def test_local_digest_normalizes_test_targets_like_deps(tmp_path: Path) -> None:
-    p = tmp_path / "tests_specs.py"
-    _write(
-        p,
-        """
+def test_local_digest_normalizes_test_targets_like_deps(sources: dict[str, str]) -> None:
+    sources["tests_specs.py"] = """
 def test_render():
     raise AssertionError
-""".lstrip(),
-    )
+""".lstrip()
     e = _entry(
         kind="test",
         spec_ref="tests.specs:test_render",
         module="tests.specs",
         qualname="test_render",
-        source_file=str(p),
+        source_file="tests_specs.py",
         decorator_kwargs={"targets": ["pkg.ui.render_screen", "pkg.ui:play_cli"]},
     )
 
@@ -82,7 +91,7 @@ def test_render():
         spec_ref="tests.specs:test_render",
         module="tests.specs",
         qualname="test_render",
-        source_file=str(p),
+        source_file="tests_specs.py",
         decorator_kwargs={"targets": ["pkg.ui:play_cli", "pkg.ui:render_screen"]},
     )
     d2 = local_digest(e2)
@@ -113,26 +122,22 @@ def Foo():
     assert d1 != d2
 
 
-def test_graph_digest_changes_when_dependency_changes(tmp_path: Path) -> None:
-    p = tmp_path / "m.py"
-    _write(
-        p,
-        """
+def test_graph_digest_changes_when_dependency_changes(sources: dict[str, str]) -> None:
+    sources["m.py"] = """
 def A():
     return 1
 
 def B():
     return A()
-""".lstrip(),
-    )
+""".lstrip()
 
-    a = _entry(kind="magic", spec_ref="m:A", module="m", qualname="A", source_file=str(p))
+    a = _entry(kind="magic", spec_ref="m:A", module="m", qualname="A", source_file="m.py")
     b = _entry(
         kind="magic",
         spec_ref="m:B",
         module="m",
         qualname="B",
-        source_file=str(p),
+        source_file="m.py",
         decorator_kwargs={"deps": ["m:A"]},
     )
     specs = {a.spec_ref: a, b.spec_ref: b}
@@ -141,17 +146,14 @@ def B():
     d1 = graph_digest(b.spec_ref, specs, spec_graph)
 
     # Update dependency source and recreate the SpecEntry so digests reflect new code.
-    _write(
-        p,
-        """
+    sources["m.py"] = """
 def A():
     return 999
 
 def B():
     return A()
-""".lstrip(),
-    )
-    a2 = _entry(kind="magic", spec_ref="m:A", module="m", qualname="A", source_file=str(p))
+""".lstrip()
+    a2 = _entry(kind="magic", spec_ref="m:A", module="m", qualname="A", source_file="m.py")
     specs2 = {a2.spec_ref: a2, b.spec_ref: b}
     spec_graph2 = build_spec_graph(specs2, infer_default=False)
 
@@ -159,26 +161,22 @@ def B():
     assert d1 != d2
 
 
-def test_module_digest_is_deterministic_and_aggregates(tmp_path: Path) -> None:
-    p = tmp_path / "m.py"
-    _write(
-        p,
-        """
+def test_module_digest_is_deterministic_and_aggregates(sources: dict[str, str]) -> None:
+    sources["m.py"] = """
 def A():
     return 1
 
 def B():
     return A()
-""".lstrip(),
-    )
+""".lstrip()
 
-    a = _entry(kind="magic", spec_ref="m:A", module="m", qualname="A", source_file=str(p))
+    a = _entry(kind="magic", spec_ref="m:A", module="m", qualname="A", source_file="m.py")
     b = _entry(
         kind="magic",
         spec_ref="m:B",
         module="m",
         qualname="B",
-        source_file=str(p),
+        source_file="m.py",
         decorator_kwargs={"deps": ["m:A"]},
     )
     specs = {a.spec_ref: a, b.spec_ref: b}
@@ -190,16 +188,27 @@ def B():
     assert re.fullmatch(r"[0-9a-f]{64}", m1) is not None
 
 
+def test_module_digest_parses_shared_source_file_once(sources: dict[str, str]) -> None:
+    sources["m.py"] = "def A():\n    return 1\n\ndef B():\n    return 2\n"
+    a = _entry(kind="magic", spec_ref="m:A", module="m", qualname="A", source_file="m.py")
+    b = _entry(kind="magic", spec_ref="m:B", module="m", qualname="B", source_file="m.py")
+    specs = {a.spec_ref: a, b.spec_ref: b}
+    spec_graph = build_spec_graph(specs, infer_default=False)
+
+    _top_level_segments.cache_clear()
+    module_digest("m", [a, b], specs, spec_graph)
+    info = _top_level_segments.cache_info()
+    assert (info.misses, info.hits) == (1, 1)
+
+
 # ---------------------------------------------------------------------------
 # Method spec digest tests
 # ---------------------------------------------------------------------------
 
 
-def test_extract_source_segment_for_method_returns_class_source(tmp_path: Path) -> None:
+def test_extract_source_segment_for_method_returns_class_source(sources: dict[str, str]) -> None:
     """For a method spec, extract_source_segment should return the entire class source."""
-    p = tmp_path / "m.py"
-    _write(
-        p,
+    sources["m.py"] = (
         "class MyService:\n"
         "    x: int = 0\n"
         "\n"
@@ -208,14 +217,14 @@ def test_extract_source_segment_for_method_returns_class_source(tmp_path: Path)
         "        ...\n"
         "\n"
         "    def helper(self) -> None:\n"
-        "        pass\n",
+        "        pass\n"
     )
     e = _entry(
         kind="magic",
         spec_ref="m:MyService.get_user",
         module="m",
         qualname="MyService.get_user",
-        source_file=str(p),
+        source_file="m.py",
     )
     seg = extract_source_segment(e)
     assert "class MyService:" in seg
@@ -224,60 +233,46 @@ def test_extract_source_segment_for_method_returns_class_source(tmp_path: Path)
     assert "x: int = 0" in seg
 
 
-def test_local_digest_for_method_changes_when_sibling_method_changes(
-    tmp_path: Path,
+_SERVICE_SRC = (
+    "class MyService:\n"
+    "    def get_user(self, uid: int) -> dict:\n"
+    "        ...\n"
+    "\n"
+    "    def helper(self) -> str:\n"
+    '        return "v1"\n'
+)
+
+
+@pytest.mark.parametrize(
+    ("edited", "expect_change"),
+    [
+        pytest.param(_SERVICE_SRC, False, id="unchanged"),
+        pytest.param(_SERVICE_SRC.replace('"v1"', '"v2"'), True, id="sibling-body"),
+        pytest.param(
+            _SERVICE_SRC + "\n    def other(self) -> None:\n        pass\n",
+            True,
+            id="sibling-added",
+        ),
+    ],
+)
+def test_local_digest_for_method_tracks_enclosing_class(
+    sources: dict[str, str], edited: str, expect_change: bool
 ) -> None:
-    """Changing a non-magic sibling method should change the method spec's digest."""
-    p = tmp_path / "m.py"
-    _write(
-        p,
-        "class MyService:\n"
-        "    def get_user(self, uid: int) -> dict:\n"
-        "        ...\n"
-        "\n"
-        "    def helper(self) -> str:\n"
-        '        return "v1"\n',
-    )
+    """A method spec's digest covers its whole class, including non-magic siblings."""
     e = _entry(
         kind="magic",
         spec_ref="m:MyService.get_user",
         module="m",
         qualname="MyService.get_user",
-        source_file=str(p),
-    )
-    d1 = local_digest(e)
-
-    _write(
-        p,
-        "class MyService:\n"
-        "    def get_user(self, uid: int) -> dict:\n"
-        "        ...\n"
-        "\n"
-        "    def helper(self) -> str:\n"
-        '        return "v2"\n',
+        source_file="m.py",
     )
-    d2 = local_digest(e)
-    assert d1 != d2
+    sources["m.py"] = _SERVICE_SRC
+    before = local_digest(e)
+    sources["m.py"] = edited
+    after = local_digest(e)
 
-
-def test_local_digest_for_method_stable_when_unchanged(tmp_path: Path) -> None:
-    """Digest should be stable when the class source doesn't change."""
-    p = tmp_path / "m.py"
-    _write(
-        p,
-        "class MyService:\n    def get_user(self, uid: int) -> dict:\n        ...\n",
-    )
-    e = _entry(
-        kind="magic",
-        spec_ref="m:MyService.get_user",
-        module="m",
-        qualname="MyService.get_user",
-        source_file=str(p),
-    )
-    d1 = local_digest(e)
-    d2 = local_digest(e)
-    assert d1 == d2
-    assert re.fullmatch(r"[0-9a-f]{64}", d1) is not None
+    assert re.fullmatch(r"[0-9a-f]{64}", after) is not None
+    assert (before != after) is expect_change
 
 
 def _members_json(src: str) -> str:
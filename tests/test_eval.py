@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import dataclasses
+import json
+import subprocess
+from pathlib import Path
+
+import pytest
+
+import jaunt.eval as jaunt_eval
+from jaunt.eval import EvalCaseResult, EvalSuiteResult, EvalTarget, StepResult
+from jaunt.eval_cases import BuiltinEvalCase
+
+_OK_STEP = StepResult(ok=True, exit_code=0, stdout="", stderr="", duration_sec=0.1)
+_PASSED_CASE = EvalCaseResult(
+    case_id="simple_function",
+    description="Generate a simple function.",
+    status="passed",
+    duration_sec=0.3,
+    skip_reason=None,
+    build=_OK_STEP,
+    assertions=_OK_STEP,
+    typecheck=_OK_STEP,
+    generated_sources={"__generated__/pkg/specs.py": "def foo():\n    return 1\n"},
+)
+
+
+@pytest.fixture(scope="module")
+def builtin_cases() -> dict[str, BuiltinEvalCase]:
+    return {c.case_id: c for c in jaunt_eval.load_cases([])}
+
+
+def _case(**changes: object) -> EvalCaseResult:
+    return dataclasses.replace(_PASSED_CASE, **changes)
+
+
+def test_load_cases_unknown_raises() -> None:
+    with pytest.raises(ValueError, match="Unknown eval case\\(s\\): nope"):
+        jaunt_eval.load_cases(["simple_function", "nope"])
+
+
+def test_run_eval_case_skips_when_required_package_missing(
+    monkeypatch: pytest.MonkeyPatch, builtin_cases: dict[str, BuiltinEvalCase]
+) -> None:
+    monkeypatch.setattr(jaunt_eval, "_module_missing", lambda name: name == "pydantic")
+
+    result = jaunt_eval.run_eval_case(
+        target=EvalTarget("openai", "gpt-5.2"), case=builtin_cases["external_library_pydantic"]
+    )
+
+    assert result.status == "skipped"
+    assert result.skip_reason == "Missing required package(s): pydantic"
+    assert result.build is None
+
+
+def test_run_eval_case_skips_when_typechecker_missing(
+    monkeypatch: pytest.MonkeyPatch, builtin_cases: dict[str, BuiltinEvalCase]
+) -> None:
+    missing_ty = dataclasses.replace(_OK_STEP, ok=False, exit_code=127)
+    monkeypatch.setattr(jaunt_eval, "_run_build", lambda root: _OK_STEP)
+    monkeypatch.setattr(jaunt_eval, "_run_assertions", lambda root, code: _OK_STEP)
+    monkeypatch.setattr(jaunt_eval, "_run_typecheck", lambda root: missing_ty)
+
+    result = jaunt_eval.run_eval_case(
+        target=EvalTarget("openai", "gpt-5.2"), case=builtin_cases["simple_function"]
+    )
+
+    assert result.status == "skipped"
+    assert result.skip_reason is not None and "'ty'" in result.skip_reason
+    assert result.typecheck == missing_ty
+
+
+def test_write_single_target_results_layout(tmp_path: Path) -> None:
+    skipped = _case(
+        case_id="external_library_pydantic",
+        status="skipped",
+        skip_reason="pydantic is not installed",
+        build=None,
+        assertions=None,
+        typecheck=None,
+        generated_sources={},
+    )
+    suite = EvalSuiteResult(
+        target=EvalTarget("openai", "gpt-5.2"),
+        started_at="2026-01-01T00:00:00Z",
+        finished_at="2026-01-01T00:00:01Z",
+        duration_sec=1.0,
+        cases=[_case(), skipped],
+    )
+
+    jaunt_eval.write_single_target_results(suite=suite, run_dir=tmp_path)
+
+    summary = json.loads((tmp_path / "summary.json").read_text(encoding="utf-8"))
+    assert summary["target"] == {"provider": "openai", "model": "gpt-5.2"}
+    assert summary["totals"] == {
+        "total": 2,
+        "passed": 1,
+        "failed": 0,
+        "skipped": 1,
+        "pass_rate": 1.0,
+    }
+    assert sorted(p.name for p in (tmp_path / "cases").iterdir()) == [
+        "external_library_pydantic.json",
+        "simple_function.json",
+    ]
+    case = json.loads((tmp_path / "cases" / "simple_function.json").read_text(encoding="utf-8"))
+    assert case["build"] == dataclasses.asdict(_OK_STEP)
+    assert case["generated_sources"] == _PASSED_CASE.generated_sources
+
+
+def test_run_subprocess_timeout_returns_exit_124(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    def _timeout(cmd: list[str], **kwargs: object) -> subprocess.CompletedProcess[str]:
+        raise subprocess.TimeoutExpired(cmd, kwargs["timeout"], output=b"partial\n", stderr="")
+
+    monkeypatch.setattr(jaunt_eval.subprocess, "run", _timeout)
+    result = jaunt_eval._run_subprocess(cmd=["ty"], cwd=tmp_path, env={}, timeout_sec=0.01)
+
+    assert result.ok is False
+    assert result.exit_code == 124
+    assert result.stdout == "partial\n"
+    assert "timed out" in result.stderr.lower()
+
+
+def test_run_subprocess_timeout_keeps_captured_stderr(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    def _timeout(cmd: list[str], **kwargs: object) -> subprocess.CompletedProcess[str]:
+        raise subprocess.TimeoutExpired(cmd, kwargs["timeout"], stderr="warming up\n")
+
+    monkeypatch.setattr(jaunt_eval.subprocess, "run", _timeout)
+    result = jaunt_eval._run_subprocess(cmd=["ty"], cwd=tmp_path, env={}, timeout_sec=2.0)
+
+    assert result.stderr == "warming up\nCommand timed out after 2.0s.\n"
+
+
+def test_load_cases_returns_independent_files() -> None:
+    (first,) = jaunt_eval.load_cases(["simple_function"])
+    first.files["src/app/specs.py"] = "mutated"
+
+    (second,) = jaunt_eval.load_cases(["simple_function"])
+
+    assert second.files["src/app/specs.py"] != "mutated"
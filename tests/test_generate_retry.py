@@ -1,9 +1,8 @@
 from __future__ import annotations
 
-import asyncio
-
 import pytest
 
+import jaunt.generate.base as base_mod
 from jaunt.generate.base import GeneratorBackend, ModuleSpecContext, TokenUsage
 
 
@@ -23,9 +22,10 @@ class DummyBackend(GeneratorBackend):
         return "def foo():\n    return 1\n", None
 
 
-def test_generate_with_retry_calls_twice_and_succeeds() -> None:
-    backend = DummyBackend()
-    ctx = ModuleSpecContext(
+@pytest.fixture(scope="module")
+def ctx() -> ModuleSpecContext:
+    """Build context expecting a single `foo`; frozen, so tests can share it."""
+    return ModuleSpecContext(
         kind="build",
         spec_module="pkg.specs",
         generated_module="__generated__.pkg.specs",
@@ -36,7 +36,12 @@ def test_generate_with_retry_calls_twice_and_succeeds() -> None:
         dependency_generated_modules={},
     )
 
-    res = asyncio.run(backend.generate_with_retry(ctx))
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_generate_with_retry_calls_twice_and_succeeds(ctx: ModuleSpecContext) -> None:
+    backend = DummyBackend()
+
+    res = await backend.generate_with_retry(ctx)
     assert backend.calls == 2
     assert res.attempts == 2
     assert res.source is not None and "def foo" in res.source
@@ -53,7 +58,8 @@ def test_base_backend_supports_structured_output_default_false() -> None:
     assert backend.supports_structured_output is False
 
 
-def test_generate_with_retry_uses_extra_validator_feedback() -> None:
+@pytest.mark.asyncio(loop_scope="module")
+async def test_generate_with_retry_uses_extra_validator_feedback(ctx: ModuleSpecContext) -> None:
     class ValidatorBackend(GeneratorBackend):
         def __init__(self) -> None:
             self.calls = 0
@@ -67,16 +73,6 @@ def test_generate_with_retry_uses_extra_validator_feedback() -> None:
             return "def foo():\n    return 1\n", None
 
     backend = ValidatorBackend()
-    ctx = ModuleSpecContext(
-        kind="build",
-        spec_module="pkg.specs",
-        generated_module="__generated__.pkg.specs",
-        expected_names=["foo"],
-        spec_sources={},
-        decorator_prompts={},
-        dependency_apis={},
-        dependency_generated_modules={},
-    )
 
     calls = {"n": 0}
 
@@ -86,9 +82,7 @@ def test_generate_with_retry_uses_extra_validator_feedback() -> None:
             return ["type check failed: implicit None return path"]
         return []
 
-    res = asyncio.run(
-        backend.generate_with_retry(ctx, max_attempts=3, extra_validator=extra_validator)
-    )
+    res = await backend.generate_with_retry(ctx, max_attempts=3, extra_validator=extra_validator)
     assert res.errors == []
     assert res.attempts == 2
     assert calls["n"] == 2
@@ -97,7 +91,10 @@ def test_generate_with_retry_uses_extra_validator_feedback() -> None:
     assert any("implicit None return path" in s for s in backend.extra_contexts[1] or [])
 
 
-def test_retry_reports_completed_attempt_usage_before_interrupt() -> None:
+@pytest.mark.asyncio(loop_scope="module")
+async def test_retry_reports_completed_attempt_usage_before_interrupt(
+    ctx: ModuleSpecContext,
+) -> None:
     class InterruptBackend(GeneratorBackend):
         def __init__(self) -> None:
             self.calls = 0
@@ -115,21 +112,37 @@ def test_retry_reports_completed_attempt_usage_before_interrupt() -> None:
             )
 
     backend = InterruptBackend()
-    ctx = ModuleSpecContext(
-        kind="build",
-        spec_module="pkg.specs",
-        generated_module="__generated__.pkg.specs",
-        expected_names=["foo"],
-        spec_sources={},
-        decorator_prompts={},
-        dependency_apis={},
-        dependency_generated_modules={},
-    )
     usages: list[TokenUsage] = []
 
     with pytest.raises(KeyboardInterrupt):
-        asyncio.run(backend.generate_with_retry(ctx, usage_callback=usages.append))
+        await backend.generate_with_retry(ctx, usage_callback=usages.append)
 
     assert len(usages) == 1
     assert usages[0].prompt_tokens == 10
     assert usages[0].completion_tokens == 4
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_generate_with_retry_skips_revalidating_identical_source(
+    monkeypatch: pytest.MonkeyPatch, ctx: ModuleSpecContext
+) -> None:
+    class RepeatBackend(GeneratorBackend):
+        async def generate_module(
+            self, ctx: ModuleSpecContext, *, extra_error_context: list[str] | None = None
+        ) -> tuple[str, None]:
+            return "def not_it():\n    return 1\n", None
+
+    validated: list[str] = []
+    real_validate = base_mod.validate_generated_source
+
+    def counting_validate(source: str, expected_names: list[str]) -> list[str]:
+        validated.append(source)
+        return real_validate(source, expected_names)
+
+    monkeypatch.setattr(base_mod, "validate_generated_source", counting_validate)
+
+    res = await RepeatBackend().generate_with_retry(ctx, max_attempts=3)
+
+    assert res.attempts == 3
+    assert res.errors == ["Missing top-level definition: foo"]
+    assert len(validated) == 1
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from jaunt.generate.shared import (
+    _load_packaged_prompt,
+    fmt_kv_block,
+    load_prompt,
+    render_template,
+    strip_markdown_fences,
+)
+
+
+def test_render_template_replaces_known_placeholders() -> None:
+    out = render_template("a={{a}} b={{b}} a={{a}}", {"a": "1", "b": "2"})
+    assert out == "a=1 b=2 a=1"
+
+
+def test_render_template_leaves_unknown_placeholders() -> None:
+    out = render_template("{{known}} {{missing}} {{...}}", {"known": "x", "unused": "y"})
+    assert out == "x {{missing}} {{...}}"
+
+
+def test_render_template_does_not_rescan_substituted_values() -> None:
+    out = render_template("{{first}}|{{second}}", {"first": "{{second}}", "second": "2"})
+    assert out == "{{second}}|2"
+
+
+@pytest.mark.parametrize(
+    "text", ["no slots here\n", "only {{missing}} here", "{{first}} and {{second}}"]
+)
+def test_render_template_returns_input_when_nothing_to_substitute(text: str) -> None:
+    assert render_template(text, {"a": "1"}) is text
+
+
+@pytest.mark.parametrize(
+    ("items", "expected"),
+    [
+        ([], "(none)"),
+        ([("a", "1\n\n"), ("b", "2  ")], "# a\n1\n\n# b\n2\n"),
+        ([("a", "1"), ("b  ", " \n")], "# a\n1\n\n# b\n"),
+    ],
+)
+def test_fmt_kv_block(items: list[tuple[str, str]], expected: str) -> None:
+    assert fmt_kv_block(items) == expected
+
+
+def test_load_prompt_reads_packaged_prompt_once() -> None:
+    _load_packaged_prompt.cache_clear()
+
+    first = load_prompt("build_system.md", None)
+    second = load_prompt("build_system.md", None)
+
+    assert first
+    assert second is first
+    info = _load_packaged_prompt.cache_info()
+    assert (info.misses, info.hits) == (1, 1)
+
+
+def test_load_prompt_rereads_override_file(tmp_path: Path) -> None:
+    override = tmp_path / "system.md"
+    override.write_text("v1\n", encoding="utf-8")
+    assert load_prompt("build_system.md", str(override)) == "v1\n"
+
+    override.write_text("v2\n", encoding="utf-8")
+    assert load_prompt("build_system.md", str(override)) == "v2\n"
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ("```python\ndef f():\n    return 1\n```", "def f():\n    return 1"),
+        ("  ```\ncode\n  ```  \n", "code"),
+        ("```\n\n```", ""),
+        ("plain text\n", "plain text"),
+        ("```\n```", "```\n```"),
+        ("```py thon\nx\n```", "```py thon\nx\n```"),
+        ("```\nx```", "```\nx```"),
+        ("```\nx\n````", "```\nx\n````"),
+        ("", ""),
+    ],
+)
+def test_strip_markdown_fences(raw: str, expected: str) -> None:
+    assert strip_markdown_fences(raw) == expected
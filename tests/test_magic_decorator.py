@@ -3,9 +3,10 @@ from __future__ import annotations
 import abc
 import importlib.util
 import inspect
+import operator
 import sys
 import textwrap
-from collections.abc import Generator
+from collections.abc import Callable, Generator
 from pathlib import Path
 from types import SimpleNamespace
 from typing import Any
@@ -53,6 +54,11 @@ class AutoTestClass:
     """spec for the magic(test=...) pass-through test."""
 
 
+TOP_FN_REF = normalize_spec_ref(f"{top_level_fn.__module__}:{top_level_fn.__qualname__}")
+TOP_CLASS_REF = normalize_spec_ref(f"{TopLevelClass.__module__}:{TopLevelClass.__qualname__}")
+AUTO_TEST_CLASS_REF = normalize_spec_ref(f"{AutoTestClass.__module__}:{AutoTestClass.__qualname__}")
+
+
 @pytest.fixture(autouse=True)
 def _clear_registries() -> Generator[None, None, None]:
     clear_registries()
@@ -60,34 +66,26 @@ def _clear_registries() -> Generator[None, None, None]:
     clear_registries()
 
 
-def test_registers_function_spec(monkeypatch: pytest.MonkeyPatch) -> None:
-    def _import(_name: str) -> Any:
-        raise ModuleNotFoundError(_name)
-
-    monkeypatch.setattr("jaunt.runtime.importlib.import_module", _import)
-
+def test_registers_function_spec(missing_import: None) -> None:
     wrapped = magic()(top_level_fn)
     reg = get_magic_registry()
-    expected_ref = normalize_spec_ref(f"{top_level_fn.__module__}:{top_level_fn.__qualname__}")
-    assert expected_ref in reg
-    assert reg[expected_ref].kind == "magic"
+    assert TOP_FN_REF in reg
+    assert reg[TOP_FN_REF].kind == "magic"
     assert callable(wrapped)
 
 
-def test_bare_and_called_forms_register_function_spec(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_bare_and_called_forms_register_function_spec(
+    built_import: Callable[[str, object], None],
+) -> None:
     def gen_fn(x: int) -> int:
         return x + 100
 
-    def _import(_name: str) -> Any:
-        return SimpleNamespace(**{top_level_fn.__qualname__: gen_fn})
-
-    monkeypatch.setattr("jaunt.runtime.importlib.import_module", _import)
+    built_import(top_level_fn.__qualname__, gen_fn)
 
     wrapped_bare = magic(top_level_fn)
-    expected_ref = normalize_spec_ref(f"{top_level_fn.__module__}:{top_level_fn.__qualname__}")
     reg = get_magic_registry()
-    assert expected_ref in reg
-    assert reg[expected_ref].kind == "magic"
+    assert TOP_FN_REF in reg
+    assert reg[TOP_FN_REF].kind == "magic"
     assert callable(wrapped_bare)
     assert wrapped_bare(1) == 101
 
@@ -95,96 +93,83 @@ def test_bare_and_called_forms_register_function_spec(monkeypatch: pytest.Monkey
 
     wrapped_called = magic()(top_level_fn)
     reg = get_magic_registry()
-    assert expected_ref in reg
-    assert reg[expected_ref].kind == "magic"
+    assert TOP_FN_REF in reg
+    assert reg[TOP_FN_REF].kind == "magic"
     assert callable(wrapped_called)
     assert wrapped_called(1) == 101
 
 
-def test_registers_class_spec(monkeypatch: pytest.MonkeyPatch) -> None:
-    def _import(_name: str) -> Any:
-        raise ModuleNotFoundError(_name)
-
-    monkeypatch.setattr("jaunt.runtime.importlib.import_module", _import)
-
+def test_registers_class_spec(missing_import: None) -> None:
     cls = magic()(TopLevelClass)
     reg = get_magic_registry()
-    expected_ref = normalize_spec_ref(f"{TopLevelClass.__module__}:{TopLevelClass.__qualname__}")
-    assert expected_ref in reg
+    assert TOP_CLASS_REF in reg
     assert isinstance(cls, type)
 
 
-def test_unbuilt_function_call_raises_actionable_error(monkeypatch: pytest.MonkeyPatch) -> None:
-    def _import(_name: str) -> Any:
-        raise ModuleNotFoundError(_name)
-
-    monkeypatch.setattr("jaunt.runtime.importlib.import_module", _import)
-
+def test_unbuilt_function_call_raises_actionable_error(missing_import: None) -> None:
     wrapped = magic()(top_level_fn)
-    with pytest.raises(JauntNotBuiltError) as exc:
+    with pytest.raises(JauntNotBuiltError, match="jaunt build"):
         wrapped(1)
-    assert "jaunt build" in str(exc.value)
 
 
-def test_unbuilt_class_instantiation_raises(monkeypatch: pytest.MonkeyPatch) -> None:
-    def _import(_name: str) -> Any:
-        raise ModuleNotFoundError(_name)
-
-    monkeypatch.setattr("jaunt.runtime.importlib.import_module", _import)
-
+def test_unbuilt_class_instantiation_raises(missing_import: None) -> None:
     Placeholder = magic()(TopLevelClass)
     with pytest.raises(JauntNotBuiltError):
         Placeholder(1)
 
 
-def test_wrapper_preserves_metadata(monkeypatch: pytest.MonkeyPatch) -> None:
-    def _import(_name: str) -> Any:
-        raise ModuleNotFoundError(_name)
-
-    monkeypatch.setattr("jaunt.runtime.importlib.import_module", _import)
-
+def test_wrapper_preserves_metadata(missing_import: None) -> None:
     wrapped = magic()(top_level_fn)
     assert wrapped.__name__ == top_level_fn.__name__
     assert wrapped.__wrapped__ is top_level_fn
 
 
-def test_decorator_kwargs_are_stored(monkeypatch: pytest.MonkeyPatch) -> None:
-    def _import(_name: str) -> Any:
-        raise ModuleNotFoundError(_name)
-
-    monkeypatch.setattr("jaunt.runtime.importlib.import_module", _import)
-
+def test_decorator_kwargs_are_stored(missing_import: None) -> None:
     magic(deps="pkg.mod:Dep", prompt="hello", infer_deps=False)(top_level_fn)
-    expected_ref = normalize_spec_ref(f"{top_level_fn.__module__}:{top_level_fn.__qualname__}")
-    got = get_magic_registry()[expected_ref]
+    got = get_magic_registry()[TOP_FN_REF]
     assert got.decorator_kwargs == {"deps": "pkg.mod:Dep", "prompt": "hello", "infer_deps": False}
 
 
-def test_built_function_forwards_call(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_built_function_forwards_call(built_import: Callable[[str, object], None]) -> None:
     def gen_fn(x: int) -> int:
         return x + 100
 
-    def _import(_name: str) -> Any:
-        # The runtime picks a generated module name; this test doesn't care what it is.
-        return SimpleNamespace(**{top_level_fn.__qualname__: gen_fn})
+    built_import(top_level_fn.__qualname__, gen_fn)
+
+    wrapped = magic()(top_level_fn)
+    assert wrapped(1) == 101
+
+
+def test_wrapper_follows_rebuilt_generated_module(monkeypatch: pytest.MonkeyPatch) -> None:
+    generated: SimpleNamespace | None = None
+
+    def _import(name: str) -> Any:
+        if generated is None:
+            raise ModuleNotFoundError(name)
+        return generated
 
     monkeypatch.setattr("jaunt.runtime.importlib.import_module", _import)
 
     wrapped = magic()(top_level_fn)
+    with pytest.raises(JauntNotBuiltError):
+        wrapped(1)
+
+    # Neither a failed lookup nor a resolved function is kept: a rebuild or reload
+    # that replaces the generated module is picked up on the next call.
+    generated = SimpleNamespace(**{top_level_fn.__qualname__: lambda x: x + 100})
     assert wrapped(1) == 101
+    generated = SimpleNamespace(**{top_level_fn.__qualname__: lambda x: x + 200})
+    assert wrapped(1) == 201
 
 
-def test_built_class_is_substituted(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_built_class_is_substituted(built_import: Callable[[str, object], None]) -> None:
     class Generated:
         def __init__(self, x: int) -> None:
             self.x = x
 
     Generated.__module__ = "some.__generated__.mod"
 
-    def _import(_name: str) -> Any:
-        return SimpleNamespace(**{TopLevelClass.__qualname__: Generated})
-
-    monkeypatch.setattr("jaunt.runtime.importlib.import_module", _import)
+    built_import(TopLevelClass.__qualname__, Generated)
 
     got_cls = magic()(TopLevelClass)
     assert got_cls is Generated
@@ -318,73 +303,45 @@ def test_magic_source_fallback_for_closure_wrapped_decorators(tmp_path: Path) ->
 # ---------------------------------------------------------------------------
 
 # Grab raw functions from the class dict (before descriptor wrapping).
-_raw_regular = HostClass.__dict__["regular_method"]
-_raw_async = HostClass.__dict__["async_method"]
-_raw_cls = HostClass.__dict__["cls_method"].__func__  # unwrap classmethod
-_raw_static = HostClass.__dict__["static_method"].__func__  # unwrap staticmethod
+_raw_regular, _raw_async, _cls_desc, _static_desc = operator.itemgetter(
+    "regular_method", "async_method", "cls_method", "static_method"
+)(HostClass.__dict__)
+_raw_cls, _raw_static = _cls_desc.__func__, _static_desc.__func__  # unwrap the descriptors
+
+REGULAR_METHOD_REF = normalize_spec_ref(f"{_raw_regular.__module__}:{_raw_regular.__qualname__}")
+CLS_METHOD_REF = normalize_spec_ref(f"{_raw_cls.__module__}:{_raw_cls.__qualname__}")
+STATIC_METHOD_REF = normalize_spec_ref(f"{_raw_static.__module__}:{_raw_static.__qualname__}")
+
+# Bare instance for the delegation tests; the generated methods never touch its state.
+_HOST_INSTANCE = object.__new__(HostClass)
 
 
 class TestMethodRegistration:
     """Tests for @magic() on class methods — registration and metadata."""
 
-    def test_regular_method_registers_with_class_name(
-        self, monkeypatch: pytest.MonkeyPatch
+    @pytest.mark.parametrize(
+        ("fn", "expected_ref", "class_name"),
+        [
+            pytest.param(_raw_regular, REGULAR_METHOD_REF, "HostClass", id="regular"),
+            pytest.param(_raw_cls, CLS_METHOD_REF, "HostClass", id="classmethod"),
+            pytest.param(_raw_static, STATIC_METHOD_REF, "HostClass", id="staticmethod"),
+            pytest.param(top_level_fn, TOP_FN_REF, None, id="top-level"),
+        ],
+    )
+    def test_registers_with_class_name(
+        self,
+        missing_import: None,
+        fn: Callable[..., object],
+        expected_ref: str,
+        class_name: str | None,
     ) -> None:
-        def _import(_name: str) -> Any:
-            raise ModuleNotFoundError(_name)
-
-        monkeypatch.setattr("jaunt.runtime.importlib.import_module", _import)
-
-        wrapped = magic()(_raw_regular)
-        reg = get_magic_registry()
-        expected_ref = normalize_spec_ref(f"{_raw_regular.__module__}:{_raw_regular.__qualname__}")
-        assert expected_ref in reg
-        entry = reg[expected_ref]
-        assert entry.class_name == "HostClass"
-        assert entry.qualname == "HostClass.regular_method"
+        wrapped = magic()(fn)
+        entry = get_magic_registry()[expected_ref]
+        assert entry.class_name == class_name
+        assert entry.qualname == fn.__qualname__
         assert callable(wrapped)
 
-    def test_top_level_function_has_no_class_name(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        def _import(_name: str) -> Any:
-            raise ModuleNotFoundError(_name)
-
-        monkeypatch.setattr("jaunt.runtime.importlib.import_module", _import)
-
-        magic()(top_level_fn)
-        reg = get_magic_registry()
-        expected_ref = normalize_spec_ref(f"{top_level_fn.__module__}:{top_level_fn.__qualname__}")
-        assert reg[expected_ref].class_name is None
-
-    def test_classmethod_function_registers(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        def _import(_name: str) -> Any:
-            raise ModuleNotFoundError(_name)
-
-        monkeypatch.setattr("jaunt.runtime.importlib.import_module", _import)
-
-        magic()(_raw_cls)
-        reg = get_magic_registry()
-        expected_ref = normalize_spec_ref(f"{_raw_cls.__module__}:{_raw_cls.__qualname__}")
-        assert expected_ref in reg
-        assert reg[expected_ref].class_name == "HostClass"
-
-    def test_staticmethod_function_registers(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        def _import(_name: str) -> Any:
-            raise ModuleNotFoundError(_name)
-
-        monkeypatch.setattr("jaunt.runtime.importlib.import_module", _import)
-
-        magic()(_raw_static)
-        reg = get_magic_registry()
-        expected_ref = normalize_spec_ref(f"{_raw_static.__module__}:{_raw_static.__qualname__}")
-        assert expected_ref in reg
-        assert reg[expected_ref].class_name == "HostClass"
-
-    def test_method_preserves_metadata(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        def _import(_name: str) -> Any:
-            raise ModuleNotFoundError(_name)
-
-        monkeypatch.setattr("jaunt.runtime.importlib.import_module", _import)
-
+    def test_method_preserves_metadata(self, missing_import: None) -> None:
         wrapped = magic()(_raw_regular)
         assert wrapped.__name__ == "regular_method"
         assert wrapped.__wrapped__ is _raw_regular
@@ -393,64 +350,44 @@ class TestMethodRegistration:
 class TestMethodWrapper:
     """Tests for @magic() on class methods — runtime wrapper behavior."""
 
-    def test_unbuilt_method_raises_not_built_error(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        def _import(_name: str) -> Any:
-            raise ModuleNotFoundError(_name)
-
-        monkeypatch.setattr("jaunt.runtime.importlib.import_module", _import)
-
+    def test_unbuilt_method_raises_not_built_error(self, missing_import: None) -> None:
         wrapped = magic()(_raw_regular)
-        instance = object.__new__(HostClass)
         with pytest.raises(JauntNotBuiltError, match="jaunt build"):
-            wrapped(instance, 1)
+            wrapped(_HOST_INSTANCE, 1)
 
     def test_built_method_delegates_to_generated_class(
-        self, monkeypatch: pytest.MonkeyPatch
+        self, built_import: Callable[[str, object], None]
     ) -> None:
         class GenClass:
             def regular_method(self, uid: int) -> dict:
                 return {"id": uid, "generated": True}
 
-        def _import(_name: str) -> Any:
-            return SimpleNamespace(HostClass=GenClass)
-
-        monkeypatch.setattr("jaunt.runtime.importlib.import_module", _import)
+        built_import("HostClass", GenClass)
 
         wrapped = magic()(_raw_regular)
-        instance = object.__new__(HostClass)
-        result = wrapped(instance, 42)
+        result = wrapped(_HOST_INSTANCE, 42)
         assert result == {"id": 42, "generated": True}
 
-    def test_async_method_registers_and_is_coroutine_function(
-        self, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        def _import(_name: str) -> Any:
-            raise ModuleNotFoundError(_name)
-
-        monkeypatch.setattr("jaunt.runtime.importlib.import_module", _import)
-
+    def test_async_method_registers_and_is_coroutine_function(self, missing_import: None) -> None:
         wrapped = magic()(_raw_async)
         assert inspect.iscoroutinefunction(wrapped)
 
-    def test_async_method_delegates_when_built(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        import asyncio
-
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_async_method_delegates_when_built(
+        self, built_import: Callable[[str, object], None]
+    ) -> None:
         class GenClass:
             async def async_method(self, uid: int) -> dict:
                 return {"id": uid, "async_generated": True}
 
-        def _import(_name: str) -> Any:
-            return SimpleNamespace(HostClass=GenClass)
-
-        monkeypatch.setattr("jaunt.runtime.importlib.import_module", _import)
+        built_import("HostClass", GenClass)
 
         wrapped = magic()(_raw_async)
-        instance = object.__new__(HostClass)
-        result = asyncio.run(wrapped(instance, 7))
+        result = await wrapped(_HOST_INSTANCE, 7)
         assert result == {"id": 7, "async_generated": True}
 
     def test_classmethod_delegates_correctly_when_generated_uses_classmethod(
-        self, monkeypatch: pytest.MonkeyPatch
+        self, built_import: Callable[[str, object], None]
     ) -> None:
         """Generated class with @classmethod must not double-pass cls."""
 
@@ -459,10 +396,7 @@ class TestMethodWrapper:
             def cls_method(cls, config: dict) -> str:
                 return f"built-{config['key']}"
 
-        def _import(_name: str) -> Any:
-            return SimpleNamespace(HostClass=GenClass)
-
-        monkeypatch.setattr("jaunt.runtime.importlib.import_module", _import)
+        built_import("HostClass", GenClass)
 
         wrapped = magic()(_raw_cls)
         # Simulate classmethod descriptor: Python passes cls as first arg
@@ -470,7 +404,7 @@ class TestMethodWrapper:
         assert result == "built-val"
 
     def test_staticmethod_delegates_correctly_when_generated_uses_staticmethod(
-        self, monkeypatch: pytest.MonkeyPatch
+        self, built_import: Callable[[str, object], None]
     ) -> None:
         """Generated class with @staticmethod must not inject extra self/cls."""
 
@@ -479,10 +413,7 @@ class TestMethodWrapper:
             def static_method(value: int) -> bool:
                 return value > 0
 
-        def _import(_name: str) -> Any:
-            return SimpleNamespace(HostClass=GenClass)
-
-        monkeypatch.setattr("jaunt.runtime.importlib.import_module", _import)
+        built_import("HostClass", GenClass)
 
         wrapped = magic()(_raw_static)
         assert wrapped(42) is True
@@ -503,32 +434,31 @@ class TestMethodEdgeCases:
         with pytest.raises(JauntError):
             magic()(fn)
 
+    def test_rejects_nested_class_methods(self) -> None:
+        def method(self) -> None: ...
+
+        method.__qualname__ = "Outer.Inner.method"
+        method.__module__ = __name__
+        with pytest.raises(JauntError, match="at most one level"):
+            magic()(method)
+
     def test_rejects_classmethod_descriptor(self) -> None:
         """Passing a classmethod descriptor (wrong order) should raise."""
-        raw_descriptor = HostClass.__dict__["cls_method"]
-        assert isinstance(raw_descriptor, classmethod)
+        assert isinstance(_cls_desc, classmethod)
         with pytest.raises(JauntError, match="classmethod|staticmethod|decorator order"):
-            magic()(raw_descriptor)
+            magic()(_cls_desc)
 
     def test_rejects_staticmethod_descriptor(self) -> None:
         """Passing a staticmethod descriptor (wrong order) should raise."""
-        raw_descriptor = HostClass.__dict__["static_method"]
-        assert isinstance(raw_descriptor, staticmethod)
+        assert isinstance(_static_desc, staticmethod)
         with pytest.raises(JauntError, match="classmethod|staticmethod|decorator order"):
-            magic()(raw_descriptor)
+            magic()(_static_desc)
 
 
 class TestAbstractMethodSupport:
     """Tests for @abstractmethod @magic() stacking."""
 
-    def test_abstract_wrapper_stays_abstract_when_unbuilt(
-        self, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        def _import(_name: str) -> Any:
-            raise ModuleNotFoundError(_name)
-
-        monkeypatch.setattr("jaunt.runtime.importlib.import_module", _import)
-
+    def test_abstract_wrapper_stays_abstract_when_unbuilt(self, missing_import: None) -> None:
         # Simulate: @abstractmethod @magic() def process(self): ...
         # Step 1: magic() wraps the raw function
         def process(self) -> None:
@@ -544,16 +474,13 @@ class TestAbstractMethodSupport:
         assert getattr(abstract_wrapper, "__isabstractmethod__", False) is True
 
     def test_abstract_flag_cleared_after_successful_call(
-        self, monkeypatch: pytest.MonkeyPatch
+        self, built_import: Callable[[str, object], None]
     ) -> None:
         class GenClass:
             def process(self) -> None:
                 pass
 
-        def _import(_name: str) -> Any:
-            return SimpleNamespace(AbstractHost=GenClass)
-
-        monkeypatch.setattr("jaunt.runtime.importlib.import_module", _import)
+        built_import("AbstractHost", GenClass)
 
         def process(self) -> None:
             """Abstract method stub."""
@@ -573,26 +500,13 @@ class TestAbstractMethodSupport:
         assert getattr(wrapper, "__isabstractmethod__", False) is False
 
 
-def test_magic_test_kwarg_recorded(monkeypatch: pytest.MonkeyPatch) -> None:
-    def _import(_name: str) -> Any:
-        raise ModuleNotFoundError(_name)
-
-    monkeypatch.setattr("jaunt.runtime.importlib.import_module", _import)
-
+def test_magic_test_kwarg_recorded(missing_import: None) -> None:
     magic(test=True)(AutoTestClass)
-    ref = normalize_spec_ref(f"{AutoTestClass.__module__}:{AutoTestClass.__qualname__}")
-    entry = get_magic_registry()[ref]
+    entry = get_magic_registry()[AUTO_TEST_CLASS_REF]
     assert entry.decorator_kwargs.get("test") is True
 
 
-def test_whole_class_records_project_base_dep(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
-) -> None:
-    def _import(_name: str) -> Any:
-        raise ModuleNotFoundError(_name)
-
-    monkeypatch.setattr("jaunt.runtime.importlib.import_module", _import)
-
+def test_whole_class_records_project_base_dep(missing_import: None, tmp_path: Path) -> None:
     clear_registries()
     module_name = "tmp_whole_class_base_dep"
     src = '''
@@ -676,14 +590,7 @@ def test_magic_class_substitution_preserves_super_composition(
 # ---------------------------------------------------------------------------
 
 
-def test_inner_magic_absorbed_into_whole_class_spec(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
-) -> None:
-    def _import(_name: str) -> Any:
-        raise ModuleNotFoundError(_name)
-
-    monkeypatch.setattr("jaunt.runtime.importlib.import_module", _import)
-
+def test_inner_magic_absorbed_into_whole_class_spec(missing_import: None, tmp_path: Path) -> None:
     clear_registries()
     module_name = "tmp_absorb_basic"
     src = '''
@@ -710,14 +617,7 @@ def test_inner_magic_absorbed_into_whole_class_spec(
         sys.modules.pop(module_name, None)
 
 
-def test_inner_magic_original_function_restored(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
-) -> None:
-    def _import(_name: str) -> Any:
-        raise ModuleNotFoundError(_name)
-
-    monkeypatch.setattr("jaunt.runtime.importlib.import_module", _import)
-
+def test_inner_magic_original_function_restored(missing_import: None, tmp_path: Path) -> None:
     clear_registries()
     module_name = "tmp_absorb_restore"
     src = '''
@@ -744,13 +644,8 @@ def test_inner_magic_original_function_restored(
 
 
 def test_inner_magic_classmethod_descriptor_reconstructed(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    missing_import: None, tmp_path: Path
 ) -> None:
-    def _import(_name: str) -> Any:
-        raise ModuleNotFoundError(_name)
-
-    monkeypatch.setattr("jaunt.runtime.importlib.import_module", _import)
-
     clear_registries()
     module_name = "tmp_absorb_classmethod"
     src = '''
@@ -776,13 +671,8 @@ def test_inner_magic_classmethod_descriptor_reconstructed(
 
 
 def test_inner_magic_staticmethod_descriptor_reconstructed(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    missing_import: None, tmp_path: Path
 ) -> None:
-    def _import(_name: str) -> Any:
-        raise ModuleNotFoundError(_name)
-
-    monkeypatch.setattr("jaunt.runtime.importlib.import_module", _import)
-
     clear_registries()
     module_name = "tmp_absorb_staticmethod"
     src = '''
@@ -807,14 +697,7 @@ def test_inner_magic_staticmethod_descriptor_reconstructed(
         sys.modules.pop(module_name, None)
 
 
-def test_inner_magic_abstractmethod_flag_carried(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
-) -> None:
-    def _import(_name: str) -> Any:
-        raise ModuleNotFoundError(_name)
-
-    monkeypatch.setattr("jaunt.runtime.importlib.import_module", _import)
-
+def test_inner_magic_abstractmethod_flag_carried(missing_import: None, tmp_path: Path) -> None:
     clear_registries()
     module_name = "tmp_absorb_abstract"
     # A plain class (metaclass ``type``) keeps the metaclass guard happy; the
@@ -844,12 +727,7 @@ def test_inner_magic_abstractmethod_flag_carried(
         sys.modules.pop(module_name, None)
 
 
-def test_inner_magic_with_kwargs_rejected(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
-    def _import(_name: str) -> Any:
-        raise ModuleNotFoundError(_name)
-
-    monkeypatch.setattr("jaunt.runtime.importlib.import_module", _import)
-
+def test_inner_magic_with_kwargs_rejected(missing_import: None, tmp_path: Path) -> None:
     clear_registries()
     module_name = "tmp_absorb_kwargs"
     src = '''
@@ -869,12 +747,7 @@ def test_inner_magic_with_kwargs_rejected(monkeypatch: pytest.MonkeyPatch, tmp_p
         sys.modules.pop(module_name, None)
 
 
-def test_inner_magic_on_property_rejected(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
-    def _import(_name: str) -> Any:
-        raise ModuleNotFoundError(_name)
-
-    monkeypatch.setattr("jaunt.runtime.importlib.import_module", _import)
-
+def test_inner_magic_on_property_rejected(missing_import: None, tmp_path: Path) -> None:
     clear_registries()
     module_name = "tmp_absorb_property"
     src = '''
@@ -895,12 +768,7 @@ def test_inner_magic_on_property_rejected(monkeypatch: pytest.MonkeyPatch, tmp_p
         sys.modules.pop(module_name, None)
 
 
-def test_standalone_method_magic_unchanged(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
-    def _import(_name: str) -> Any:
-        raise ModuleNotFoundError(_name)
-
-    monkeypatch.setattr("jaunt.runtime.importlib.import_module", _import)
-
+def test_standalone_method_magic_unchanged(missing_import: None, tmp_path: Path) -> None:
     clear_registries()
     module_name = "tmp_standalone_method"
     src = """
@@ -924,14 +792,7 @@ def test_standalone_method_magic_unchanged(monkeypatch: pytest.MonkeyPatch, tmp_
 # ---------------------------------------------------------------------------
 
 
-def test_sig_absorbed_into_whole_class_spec(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
-) -> None:
-    def _import(_name: str) -> Any:
-        raise ModuleNotFoundError(_name)
-
-    monkeypatch.setattr("jaunt.runtime.importlib.import_module", _import)
-
+def test_sig_absorbed_into_whole_class_spec(missing_import: None, tmp_path: Path) -> None:
     clear_registries()
     module_name = "tmp_sig_basic"
     src = '''
@@ -958,12 +819,7 @@ def test_sig_absorbed_into_whole_class_spec(
         sys.modules.pop(module_name, None)
 
 
-def test_sig_called_form_absorbed(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
-    def _import(_name: str) -> Any:
-        raise ModuleNotFoundError(_name)
-
-    monkeypatch.setattr("jaunt.runtime.importlib.import_module", _import)
-
+def test_sig_called_form_absorbed(missing_import: None, tmp_path: Path) -> None:
     clear_registries()
     module_name = "tmp_sig_called"
     src = '''
@@ -984,16 +840,9 @@ def test_sig_called_form_absorbed(monkeypatch: pytest.MonkeyPatch, tmp_path: Pat
         sys.modules.pop(module_name, None)
 
 
-def test_sig_matches_inner_magic_registry_state(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
-) -> None:
+def test_sig_matches_inner_magic_registry_state(missing_import: None, tmp_path: Path) -> None:
     """@sig and inner bare @magic produce identical whole-class registry state."""
 
-    def _import(_name: str) -> Any:
-        raise ModuleNotFoundError(_name)
-
-    monkeypatch.setattr("jaunt.runtime.importlib.import_module", _import)
-
     def _build(module_name: str, marker: str) -> Any:
         clear_registries()
         src = f'''
@@ -1020,12 +869,7 @@ def test_sig_matches_inner_magic_registry_state(
         sys.modules.pop("tmp_eq_sig", None)
 
 
-def test_sig_original_function_restored(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
-    def _import(_name: str) -> Any:
-        raise ModuleNotFoundError(_name)
-
-    monkeypatch.setattr("jaunt.runtime.importlib.import_module", _import)
-
+def test_sig_original_function_restored(missing_import: None, tmp_path: Path) -> None:
     clear_registries()
     module_name = "tmp_sig_restore"
     src = '''
@@ -1050,14 +894,7 @@ def test_sig_original_function_restored(monkeypatch: pytest.MonkeyPatch, tmp_pat
         sys.modules.pop(module_name, None)
 
 
-def test_sig_classmethod_descriptor_reconstructed(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
-) -> None:
-    def _import(_name: str) -> Any:
-        raise ModuleNotFoundError(_name)
-
-    monkeypatch.setattr("jaunt.runtime.importlib.import_module", _import)
-
+def test_sig_classmethod_descriptor_reconstructed(missing_import: None, tmp_path: Path) -> None:
     clear_registries()
     module_name = "tmp_sig_classmethod"
     src = '''
@@ -1082,11 +919,7 @@ def test_sig_classmethod_descriptor_reconstructed(
         sys.modules.pop(module_name, None)
 
 
-def test_sig_with_kwargs_rejected(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
-    monkeypatch.setattr(
-        "jaunt.runtime.importlib.import_module",
-        lambda _n: (_ for _ in ()).throw(ModuleNotFoundError(_n)),
-    )
+def test_sig_with_kwargs_rejected(missing_import: None, tmp_path: Path) -> None:
     clear_registries()
     module_name = "tmp_sig_kwargs"
     src = '''
@@ -1124,11 +957,7 @@ def test_sig_with_extra_positional_arg_rejected() -> None:
         jaunt.sig(fn, "extra")  # type: ignore[no-matching-overload]
 
 
-def test_sig_on_property_rejected(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
-    monkeypatch.setattr(
-        "jaunt.runtime.importlib.import_module",
-        lambda _n: (_ for _ in ()).throw(ModuleNotFoundError(_n)),
-    )
+def test_sig_on_property_rejected(missing_import: None, tmp_path: Path) -> None:
     clear_registries()
     module_name = "tmp_sig_property"
     src = '''
@@ -1149,13 +978,7 @@ def test_sig_on_property_rejected(monkeypatch: pytest.MonkeyPatch, tmp_path: Pat
         sys.modules.pop(module_name, None)
 
 
-def test_sig_on_top_level_function_rejected(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
-) -> None:
-    monkeypatch.setattr(
-        "jaunt.runtime.importlib.import_module",
-        lambda _n: (_ for _ in ()).throw(ModuleNotFoundError(_n)),
-    )
+def test_sig_on_top_level_function_rejected(missing_import: None, tmp_path: Path) -> None:
     clear_registries()
     module_name = "tmp_sig_toplevel"
     src = """
@@ -10,6 +10,8 @@ These tests validate that the rendered prompts include guidance for:
 
 from __future__ import annotations
 
+import pytest
+
 from jaunt.generate.base import ModuleSpecContext
 from jaunt.generate.shared import async_test_info, fmt_kv_block, load_prompt, render_template
 
@@ -99,23 +101,34 @@ def _render(ctx: ModuleSpecContext) -> tuple[str, str]:
     return system, user
 
 
+# Rendered once per module: ``ModuleSpecContext`` is frozen and the templates are static.
+@pytest.fixture(scope="module")
+def rendered_build() -> tuple[str, str]:
+    return _render(_build_ctx())
+
+
+@pytest.fixture(scope="module")
+def rendered_test() -> tuple[str, str]:
+    return _render(_test_ctx())
+
+
 # ---------------------------------------------------------------------------
 # Build system prompt
 # ---------------------------------------------------------------------------
 
 
-def test_build_system_spec_interpretation_guidance(monkeypatch) -> None:
+def test_build_system_spec_interpretation_guidance(rendered_build: tuple[str, str]) -> None:
     """Build system prompt should guide the LLM to read spec docstrings and signatures."""
-    system, _user = _render(_build_ctx())
+    system, _user = rendered_build
     text = system.lower()
     assert "docstring" in text
     assert "type hint" in text or "type annotation" in text
     assert "signature" in text or "parameter" in text
 
 
-def test_build_system_code_quality_guidance(monkeypatch) -> None:
+def test_build_system_code_quality_guidance(rendered_build: tuple[str, str]) -> None:
     """Build system prompt should set code quality expectations (type annotations, imports)."""
-    system, _user = _render(_build_ctx())
+    system, _user = rendered_build
     text = system.lower()
     assert "type annotation" in text or "type hint" in text
     assert "import" in text
@@ -126,25 +139,25 @@ def test_build_system_code_quality_guidance(monkeypatch) -> None:
 # ---------------------------------------------------------------------------
 
 
-def test_build_module_decorator_prompt_explanation(monkeypatch) -> None:
+def test_build_module_decorator_prompt_explanation(rendered_build: tuple[str, str]) -> None:
     """Build user prompt should explain what '# Decorator prompt' sections mean."""
-    _system, user = _render(_build_ctx())
+    _system, user = rendered_build
     text = user.lower()
     assert "decorator prompt" in text
     assert "instruction" in text or "user-provided" in text or "supplement" in text
 
 
-def test_build_module_import_guidance(monkeypatch) -> None:
+def test_build_module_import_guidance(rendered_build: tuple[str, str]) -> None:
     """Build user prompt should explain how to import from dependency modules."""
-    _system, user = _render(_build_ctx())
+    _system, user = rendered_build
     text = user.lower()
     assert "import" in text
     assert "<module>" in text or "module" in text
 
 
-def test_build_module_sanctions_third_party_imports(monkeypatch) -> None:
+def test_build_module_sanctions_third_party_imports(rendered_build: tuple[str, str]) -> None:
     """Build user prompt should permit stdlib + declared third-party imports (finding 27)."""
-    _system, user = _render(_build_ctx())
+    _system, user = rendered_build
     text = user.lower()
     # Spec-registry deps are still constrained to their declared paths...
     assert "spec-registry" in text
@@ -154,30 +167,30 @@ def test_build_module_sanctions_third_party_imports(monkeypatch) -> None:
     assert "fair game" in text
 
 
-def test_build_module_decorator_api_guidance(monkeypatch) -> None:
+def test_build_module_decorator_api_guidance(rendered_build: tuple[str, str]) -> None:
     """Build user prompt should explain decorator-derived API context."""
-    _system, user = _render(_build_ctx())
+    _system, user = rendered_build
     text = user.lower()
     assert "decorator dependency apis" in text
     assert "effective_signature" in text
 
 
-def test_build_module_spec_reading_guidance(monkeypatch) -> None:
+def test_build_module_spec_reading_guidance(rendered_build: tuple[str, str]) -> None:
     """Build user prompt should tell the LLM how to read specs (docstrings, signatures)."""
-    _system, user = _render(_build_ctx())
+    _system, user = rendered_build
     text = user.lower()
     assert "docstring" in text
     assert "signature" in text or "parameter" in text
 
 
-def test_build_module_mentions_handwritten_symbol_reuse(monkeypatch) -> None:
-    _system, user = _render(_build_ctx())
+def test_build_module_mentions_handwritten_symbol_reuse(rendered_build: tuple[str, str]) -> None:
+    _system, user = rendered_build
     text = user.lower()
     assert "handwritten source-module symbols" in text
     assert "do not redefine" in text
 
 
-def test_build_module_mentions_additional_build_instructions(monkeypatch) -> None:
+def test_build_module_mentions_additional_build_instructions() -> None:
     _system, user = _render(
         _build_ctx(build_instructions_block="- Prefer composable helpers.\n"),
     )
@@ -191,9 +204,9 @@ def test_build_module_mentions_additional_build_instructions(monkeypatch) -> Non
 # ---------------------------------------------------------------------------
 
 
-def test_test_system_test_quality_guidance(monkeypatch) -> None:
+def test_test_system_test_quality_guidance(rendered_test: tuple[str, str]) -> None:
     """Test system prompt should include test quality guidance (edge cases, assertions)."""
-    system, _user = _render(_test_ctx())
+    system, _user = rendered_test
     text = system.lower()
     assert "edge case" in text or "boundary" in text
     assert "assert" in text
@@ -204,23 +217,23 @@ def test_test_system_test_quality_guidance(monkeypatch) -> None:
 # ---------------------------------------------------------------------------
 
 
-def test_test_module_testing_strategy_guidance(monkeypatch) -> None:
+def test_test_module_testing_strategy_guidance(rendered_test: tuple[str, str]) -> None:
     """Test user prompt should guide on testing strategy (happy path, edge cases, assertions)."""
-    _system, user = _render(_test_ctx())
+    _system, user = rendered_test
     text = user.lower()
     assert "happy path" in text or "normal" in text or "expected" in text
     assert "edge case" in text or "error" in text or "boundary" in text
     assert "assert" in text
 
 
-def test_test_module_import_path_guidance(monkeypatch) -> None:
+def test_test_module_import_path_guidance(rendered_test: tuple[str, str]) -> None:
     """Test user prompt should explain the <module>:<qualname> import convention."""
-    _system, user = _render(_test_ctx())
+    _system, user = rendered_test
     assert "<module>:<qualname>" in user or "<module>" in user
 
 
-def test_test_module_mentions_public_api_only_policy(monkeypatch) -> None:
-    _system, user = _render(_test_ctx())
+def test_test_module_mentions_public_api_only_policy(rendered_test: tuple[str, str]) -> None:
+    _system, user = rendered_test
     text = user.lower()
     assert "public api only" in text
     assert "wrapper internals" in text or "generated module internals" in text
@@ -231,14 +244,14 @@ def test_test_module_mentions_public_api_only_policy(monkeypatch) -> None:
 # ---------------------------------------------------------------------------
 
 
-def test_build_prompts_no_test_rule(monkeypatch) -> None:
+def test_build_prompts_no_test_rule(rendered_build: tuple[str, str]) -> None:
     """Build prompts must still tell the LLM not to generate tests."""
-    system, user = _render(_build_ctx())
+    system, user = rendered_build
     assert "Do not write tests" in system or "Do not generate tests" in user
 
 
-def test_test_prompts_test_only_rule(monkeypatch) -> None:
+def test_test_prompts_test_only_rule(rendered_test: tuple[str, str]) -> None:
     """Test prompts must still tell the LLM to generate tests only."""
-    system, user = _render(_test_ctx())
+    system, user = rendered_test
     assert "tests only" in system or "Generate tests only" in user
     assert "Do not guess" in user
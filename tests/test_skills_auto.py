@@ -10,6 +10,9 @@ from jaunt.errors import JauntBudgetExceededError, JauntQuotaGenerationError
 from jaunt.external_imports import discover_external_distributions
 from jaunt.skills_auto import _format_generated_skill_file, ensure_pypi_skills, skill_md_path
 
+# Frozen, so every test can pass the same instance.
+_LLM_CONFIG = LLMConfig(provider="openai", model="gpt-test", api_key_env="OPENAI_API_KEY")
+
 
 def _write(path: Path, text: str) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
@@ -85,7 +88,7 @@ def test_auto_false_disables_injection(tmp_path: Path, monkeypatch) -> None:
             project_root=tmp_path,
             source_roots=[],
             generated_dir="__generated__",
-            llm=LLMConfig(provider="openai", model="gpt-test", api_key_env="OPENAI_API_KEY"),
+            llm=_LLM_CONFIG,
             skills=SkillsConfig(auto=False),
         )
     )
@@ -117,7 +120,7 @@ def test_existing_generated_skill_same_version_skips_regen(tmp_path: Path, monke
             project_root=tmp_path,
             source_roots=[],
             generated_dir="__generated__",
-            llm=LLMConfig(provider="openai", model="gpt-test", api_key_env="OPENAI_API_KEY"),
+            llm=_LLM_CONFIG,
             agent=AgentConfig(engine="codex"),
         )
     )
@@ -163,7 +166,7 @@ def test_existing_generated_skill_version_change_regenerates(tmp_path: Path, mon
             project_root=tmp_path,
             source_roots=[],
             generated_dir="__generated__",
-            llm=LLMConfig(provider="openai", model="gpt-test", api_key_env="OPENAI_API_KEY"),
+            llm=_LLM_CONFIG,
             agent=AgentConfig(engine="codex"),
         )
     )
@@ -242,7 +245,7 @@ def test_skill_generation_runs_concurrently(tmp_path: Path, monkeypatch) -> None
             project_root=tmp_path,
             source_roots=[],
             generated_dir="__generated__",
-            llm=LLMConfig(provider="openai", model="gpt-test", api_key_env="OPENAI_API_KEY"),
+            llm=_LLM_CONFIG,
             agent=AgentConfig(engine="codex"),
         )
     )
@@ -280,7 +283,7 @@ def test_no_pypi_dists_leaves_user_skills_untouched(tmp_path: Path, monkeypatch)
             project_root=tmp_path,
             source_roots=[],
             generated_dir="__generated__",
-            llm=LLMConfig(provider="openai", model="gpt-test", api_key_env="OPENAI_API_KEY"),
+            llm=_LLM_CONFIG,
         )
     )
     assert res.dists == {}
@@ -309,7 +312,7 @@ def test_user_managed_skill_never_overwritten(tmp_path: Path, monkeypatch) -> No
             project_root=tmp_path,
             source_roots=[],
             generated_dir="__generated__",
-            llm=LLMConfig(provider="openai", model="gpt-test", api_key_env="OPENAI_API_KEY"),
+            llm=_LLM_CONFIG,
         )
     )
     assert path.read_text(encoding="utf-8") == "USER SKILL\n"
@@ -382,7 +385,7 @@ def test_workspace_internal_dist_skips_pypi_lookup(tmp_path: Path, monkeypatch)
             project_root=tmp_path,
             source_roots=[],
             generated_dir="__generated__",
-            llm=LLMConfig(provider="openai", model="gpt-test", api_key_env="OPENAI_API_KEY"),
+            llm=_LLM_CONFIG,
             agent=AgentConfig(engine="codex"),
         )
     )
@@ -424,7 +427,7 @@ def test_missing_heading_warnings_deduped_into_summary(tmp_path: Path, monkeypat
             project_root=tmp_path,
             source_roots=[],
             generated_dir="__generated__",
-            llm=LLMConfig(provider="openai", model="gpt-test", api_key_env="OPENAI_API_KEY"),
+            llm=_LLM_CONFIG,
             agent=AgentConfig(engine="codex"),
         )
     )
@@ -485,7 +488,7 @@ def test_codex_skill_generator_selected_when_agent_engine_is_codex(
             project_root=tmp_path,
             source_roots=[],
             generated_dir="__generated__",
-            llm=LLMConfig(provider="openai", model="gpt-test", api_key_env="OPENAI_API_KEY"),
+            llm=_LLM_CONFIG,
             agent=AgentConfig(engine="codex"),
             codex=CodexConfig(),
         )
@@ -21,6 +21,13 @@ def test_normalize_nested_qualname_stability_for_colon_form() -> None:
     assert normalize_spec_ref("pkg.mod:Outer.Inner") == "pkg.mod:Outer.Inner"
 
 
+def test_normalize_returns_shared_string_for_equal_refs() -> None:
+    a = normalize_spec_ref(" pkg.mod:Shared ".strip())
+    b = normalize_spec_ref("".join(["pkg.mod", ":", "Shared"]))
+    c = normalize_spec_ref("pkg.mod.Shared")
+    assert a is b is c
+
+
 def test_normalize_rejects_obviously_invalid_inputs() -> None:
     with pytest.raises(ValueError):
         normalize_spec_ref("")